@@ -0,0 +1,43 @@
+from random import randrange
+from hyperelliptic import FiniteField
+import hyperelliptic.berlekamp as berlekamp
+
+
+def test_berlekamp_matrix():
+    gf = FiniteField(3)
+    poly = gf.poly([1, 0, 1]) * gf.poly([1, 1, 2])
+    matrix = berlekamp.berlekamp_matrix(gf, poly._to_ints())
+    # Dimension of Berlekamp subalgebra is the number of irreducible factors
+    assert matrix.shape == (4, 4) and matrix.rank() == 2
+    assert len(matrix.transpose().nullspace()) == 2
+
+
+def test_berlekamp_factors():
+    for p in [2, 3, 5]:
+        gf = FiniteField(p)
+        irreducible = {}
+        while len(irreducible) < 5:
+            poly = gf.rand_irreducible_poly(randrange(1, 6))
+            irreducible[tuple(poly._to_ints())] = poly
+
+        product = gf.poly([1])
+        for poly in irreducible.values():
+            product *= poly
+        factors = berlekamp.berlekamp_factors(gf, product._to_ints())
+        assert sorted(map(tuple, factors)) == sorted(irreducible)
+
+
+def test_polynomials_use_berlekamp(monkeypatch):
+    gf = FiniteField(3)
+    p1, p2, p3 = gf.poly([1, 1]), gf.poly([1, 0, 1]), gf.poly([1, 0, 2, 1])
+    poly = p1**3 * p2**4 * p3 * gf.poly([1, 1, 2])
+
+    monkeypatch.setattr(berlekamp, "BERLEKAMP_THRESHOLD", 1)
+    assert p3._uses_berlekamp()
+    factors = poly.factors()
+    monkeypatch.setattr(berlekamp, "MAX_BERLEKAMP_PRIME", 2)
+    assert not p3._uses_berlekamp()
+
+    assert sorted(map(str, poly.factors())) == sorted(map(str, factors))
+    assert factors.count(p1) == 3 and factors.count(p2) == 4 and p3 in factors
+    assert len(factors) == 9
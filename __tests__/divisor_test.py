@@ -1,4 +1,4 @@
-from hyperelliptic import FiniteField
+from hyperelliptic import Divisor, FiniteField
 
 
 def test_constructor():
@@ -33,6 +33,26 @@ def test_constructor():
     assert (d3.v**2 + d3.v * d3.c.h - d3.c.f) % d3.u == 0
 
 
+def test_interpolation_of_many_points():
+    gf = FiniteField(10007)
+    c = gf.hyperelliptic(gf.poly([0]), gf.poly([1, 0, 3, 2, 0, 3]))
+    points = [(gf(x), gf(3 * x * x + 1)) for x in range(1, 60)]
+
+    d = Divisor.from_points(c, points)
+    assert d.u.deg == 59 and d.v.deg < 59
+    assert all(d.u(x) == 0 and d.v(x) == y for x, y in points)
+
+    base = FiniteField(7)
+    gf = base.extension(base.poly([1, 0, 1]))
+    c = gf.hyperelliptic(gf.poly([0]), gf.poly([1, 0, 0, 0, 0, 1]))
+    points = [(gf.element([x, 1]), gf.element([x])) for x in range(5)]
+
+    d = Divisor.from_points(c, points + [points[0]])
+    assert d.u.deg == 6 and d.v.deg < 5
+    assert d.u % gf.poly([gf.one(), -points[0][0]]) ** 2 == gf.poly([0])
+    assert all(d.v(x) == y for x, y in points)
+
+
 def test_points_from_divisor():
     gf = FiniteField(5)
 
@@ -79,3 +99,42 @@ def test_addition():
     assert d2 + dz == d2
     assert d3 + dz == d3
     assert dz + dz == dz
+
+
+def test_addition_of_points():
+    gf = FiniteField(10007)
+    c = gf.hyperelliptic(gf.poly([0]), gf.poly([1, 0, 3, 2, 0, 3]))
+    points = [p for p in map(c._point_from_x, range(1, 100)) if p is not None]
+    p1, p2 = points[:2]
+
+    d1 = c.divisor_from_points([p1])
+    d2 = c.divisor_from_points([p2])
+    assert d1 + d2 == c.divisor_from_points([p1, p2])
+    assert d1 + c.divisor_from_points([c.point_inverse(p1)]) == c.zero_divisor()
+
+
+def test_explicit_formulas_match_cantor(monkeypatch):
+    for p in [13, 10007, 2**61 - 1]:
+        gf = FiniteField(p)
+        c = gf.hyperelliptic(gf.poly([0]), gf.poly([1, 5, 0, 3, 2, 7]))
+        assert c._explicit_f is not None
+
+        # Points with distinct x give valid divisors of degree 1 and 2
+        xs = range(1, min(p, 40))
+        points = [q for q in map(c._point_from_x, xs) if q is not None][:8]
+        divisors = [c.divisor_from_points(points[i : i + 2]) for i in range(0, 8, 2)]
+        divisors += [c.divisor_from_points([q]) for q in points[:3]]
+        divisors += [-d for d in divisors] + [d + d for d in divisors]
+
+        explicit = [[d1 + d2 for d2 in divisors] for d1 in divisors]
+        monkeypatch.setattr(c, "_explicit_f", None)
+        cantor = [[d1 + d2 for d2 in divisors] for d1 in divisors]
+        monkeypatch.undo()
+
+        assert explicit == cantor
+
+        d, k = divisors[0], 123456789
+        explicit = d * k
+        monkeypatch.setattr(c, "_explicit_f", None)
+        assert d * k == explicit
+        monkeypatch.undo()
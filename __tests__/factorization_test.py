@@ -0,0 +1,75 @@
+import pytest
+
+from hyperelliptic import (
+    check_factorization,
+    factor,
+    factorize,
+    divisors,
+    trial_division,
+    pollard_rho_brent,
+    pollard_pm1,
+    ecm,
+)
+
+P1 = 1000000007
+P2 = 998244353
+P3 = 2305843009213693951  # 2^61 - 1
+
+
+def test_factorize():
+    assert factorize(1) == {}
+    assert factorize(2) == {2: 1}
+    assert factorize(2**10 * 3**4 * 13) == {2: 10, 3: 4, 13: 1}
+    assert factorize(P1 * P2) == {P2: 1, P1: 1}
+    assert factorize(P1**3 * P3**2) == {P1: 3, P3: 2}
+    assert factorize(P3) == {P3: 1}
+
+
+def test_factor():
+    assert factor(2**10 * 3**4 * 13) == 2
+    assert factor(P1 * P2) == P2
+    assert factor(P3) == P3
+
+    for n in [1, 0, -5]:
+        with pytest.raises(ValueError):
+            factor(n)
+
+
+def test_check_factorization():
+    assert check_factorization(P1 * 12, {P1: 1, 3: 1, 2: 2}) == {2: 2, 3: 1, P1: 1}
+    assert check_factorization(1, {}) == {}
+
+    with pytest.raises(ValueError):
+        check_factorization(12, {2: 1, 3: 1})
+    with pytest.raises(ValueError):
+        check_factorization(12, {4: 1, 3: 1})
+
+
+def test_divisors():
+    assert divisors(1) == [1]
+    assert divisors(12) == [1, 2, 3, 4, 6, 12]
+    assert divisors({2: 2, 3: 1}) == [1, 2, 3, 4, 6, 12]
+    assert len(divisors(2**10)) == 11
+
+
+def test_trial_division():
+    assert trial_division(2**5 * 7 * P1) == ({2: 5, 7: 1}, P1)
+    assert trial_division(97 * 101, bound=100) == ({97: 1, 101: 1}, 1)
+
+
+def test_factoring_methods():
+    n = P1 * P2
+
+    assert pollard_rho_brent(n) in [P1, P2]
+    assert ecm(n) in [P1, P2]
+    # 2^61 - 2 = 2 * 3^2 * 5^2 * 7 * 11 * 13 * 31 * 41 * 61 * 151 * 331 * 1321
+    assert pollard_pm1(P3 * 1000000000000000003, b1=2000, b2=10000) == P3
+
+
+def test_ecm_small_numbers():
+    assert ecm(4) == 2 and ecm(6) == 2 and ecm(35) == 5
+    assert ecm(7) is None and ecm(4093) is None
+    assert ecm(61 * 67) in [61, 67]
+
+    with pytest.raises(ValueError):
+        ecm(1)
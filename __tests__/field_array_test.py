@@ -0,0 +1,91 @@
+import pytest
+from hyperelliptic import FiniteField
+
+np = pytest.importorskip("numpy")
+
+
+def test_constructor():
+    gf = FiniteField(11)
+
+    assert gf.array([1, 2, 13]) == [gf(1), gf(2), gf(2)]
+    assert gf.array([gf(3), -1]) == [gf(3), gf(10)]
+    assert gf.array(gf.get_elements()).to_list() == [gf(x) for x in range(11)]
+    assert len(gf.rand_array(20)) == 20
+
+    with pytest.raises(ValueError):
+        FiniteField(2**61 - 1).array([1, 2])
+
+
+def test_arithmetic_matches_scalar_path():
+    gf = FiniteField(2**31 - 1)
+    a = gf.rand_array(50)
+    b = gf.rand_array(50)
+    c = gf(123456789)
+
+    xs, ys = a.to_list(), b.to_list()
+
+    assert (a + b).to_list() == [x + y for x, y in zip(xs, ys)]
+    assert (a - b).to_list() == [x - y for x, y in zip(xs, ys)]
+    assert (a * b).to_list() == [x * y for x, y in zip(xs, ys)]
+    assert (a * c).to_list() == [x * c for x in xs]
+    assert (c * a).to_list() == [c * x for x in xs]
+    assert (-a).to_list() == [-x for x in xs]
+    assert (a**65537).to_list() == [x**65537 for x in xs]
+    assert (5 - a).to_list() == [gf(5) - x for x in xs]
+
+
+def test_inverse_and_division():
+    gf = FiniteField(11)
+    a = gf.array(range(1, 11))
+
+    assert a.inverse().to_list() == [x.inverse() for x in a]
+    assert (a / a).to_list() == [gf.one()] * 10
+    assert (a / 2).to_list() == [x / 2 for x in a]
+
+    with pytest.raises(ZeroDivisionError):
+        gf.array([1, 0]).inverse()
+
+
+def test_legendre():
+    gf = FiniteField(11)
+    a = gf.array(gf.get_elements())
+
+    expected = [0] + [1 if gf(x).is_quadratic_residue() else -1 for x in range(1, 11)]
+    assert list(a.legendre()) == expected
+    assert list(a.is_quadratic_residue()) == [x.is_quadratic_residue() for x in a]
+
+    gf = FiniteField(2)
+    assert list(gf.array([0, 1, 0]).legendre()) == [0, 1, 0]
+
+
+def test_reductions():
+    gf = FiniteField(1009)
+    a = gf.rand_array(101)
+
+    total, product = gf.zero(), gf.one()
+    for x in a:
+        total += x
+        product *= x
+
+    assert a.sum() == total
+    assert a.prod() == product
+    assert gf.array([]).prod() == gf.one()
+
+
+def test_different_gf():
+    a = FiniteField(11).array([1, 2])
+    b = FiniteField(7).array([1, 2])
+
+    with pytest.raises(ValueError):
+        a + b
+
+    with pytest.raises(ValueError):
+        a * FiniteField(7)(3)
+
+
+def test_polynomial_evaluation():
+    gf = FiniteField(11)
+    f = gf.poly([1, 0, 3, 7, 1, 2])
+    a = gf.array(gf.get_elements())
+
+    assert f(a).to_list() == [f(x) for x in range(11)]
@@ -0,0 +1,77 @@
+from random import randint
+import pytest
+from hyperelliptic import FiniteField, Polynomial
+
+
+def test_scalar_operations():
+    ctx = FiniteField(11).ctx
+
+    assert ctx.add(7, 7) == 3
+    assert ctx.sub(4, 5) == 10
+    assert ctx.neg(0) == 0 and ctx.neg(1) == 10
+    assert ctx.mul(7, 7) == 5
+    assert ctx.sqr(4) == 5
+    assert ctx.inv(4) == 3
+    assert ctx.div(2, 4) == 6
+    assert ctx.pow(7, 11) == 7
+
+    with pytest.raises(ZeroDivisionError):
+        ctx.inv(0)
+
+
+def test_polynomial_operations():
+    ctx = FiniteField(11).ctx
+
+    p1 = [1, 0, 1, 8, 9, 7]
+    p2 = [1, 0, 3, 4]
+    expected_product = Polynomial(p1) * Polynomial(p2)
+
+    assert ctx.poly_add(p1, p2) == [1, 0, 2, 8, 1, 0]
+    assert ctx.poly_sub(p2, p1) == [10, 0, 0, 3, 5, 8]
+    assert ctx.poly_add(p1, ctx.poly_neg(p1)) == [0]
+    assert ctx.poly_mul(p1, p2) == [c % 11 for c in expected_product.coeff]
+    assert ctx.poly_divmod(p1, p2) == ([1, 0, 9], [4, 4, 4])
+    assert ctx.poly_divmod(p2, p1) == ([0], p2)
+    assert ctx.poly_mod(p1, p2) == [4, 4, 4]
+    assert ctx.poly_mod(p1, [3, 0, 9, 1]) == ctx.poly_divmod(p1, [3, 0, 9, 1])[1]
+
+    with pytest.raises(ZeroDivisionError):
+        ctx.poly_divmod(p1, [0])
+
+
+def test_polynomials_use_context():
+    gf = FiniteField(11)
+    gf_2 = FiniteField(7)
+
+    p1 = gf.poly([1, 0, 1, 8, 9, 7])
+    p2 = gf.poly([1, 0, 3, 4])
+
+    assert (p1 * p2).coeff == [gf(c) for c in [1, 0, 4, 1, 1, 2, 4, 2, 6]]
+    assert p1 / gf(3) == gf.poly([4, 0, 4, 10, 3, 6])
+
+    with pytest.raises(ValueError):
+        p1 + gf_2.poly([1, 0, 3, 4])
+
+    with pytest.raises(ValueError):
+        p1 * gf_2(3)
+
+
+def test_kronecker_substitution():
+    for p in [2, 11, 2**61 - 1]:
+        ctx = FiniteField(p).ctx
+        a = [randint(1, p - 1)] + [randint(0, p - 1) for _ in range(30)]
+        b = [randint(1, p - 1)] + [randint(0, p - 1) for _ in range(19)]
+        expected = [c % p for c in (Polynomial(a) * Polynomial(b)).coeff]
+
+        assert ctx.poly_mul(a, b) == expected
+        assert ctx.poly_sqr(a) == [c % p for c in (Polynomial(a) ** 2).coeff]
+        assert ctx.poly_mul(a, [0] * 10) == [0]
+
+
+def test_polynomial_square_uses_context():
+    gf = FiniteField(13)
+    p1 = gf.poly([randint(1, 12)] + [randint(0, 12) for _ in range(20)])
+    p2 = gf.poly(p1.coeff)
+
+    assert p1 * p1 == p1 * p2
+    assert p1**5 == p1 * p2 * p2 * p2 * p2
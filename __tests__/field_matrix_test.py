@@ -0,0 +1,114 @@
+from random import randrange
+import pytest
+from hyperelliptic import FiniteField, FieldMatrix
+
+
+def random_matrix(gf, rows, cols):
+    return gf.matrix([[randrange(gf.p) for _ in range(cols)] for _ in range(rows)])
+
+
+def test_constructor():
+    gf = FiniteField(11)
+    m = gf.matrix([[1, 12], [gf(3), -1]])
+
+    assert m.shape == (2, 2)
+    assert m == [[gf(1), gf(1)], [gf(3), gf(10)]]
+    assert m[1] == [gf(3), gf(10)] and m[0, 1] == gf(1)
+    assert m.transpose() == gf.matrix([[1, 3], [1, 10]])
+    assert FieldMatrix.identity(gf, 2) == gf.matrix([[1, 0], [0, 1]])
+
+    with pytest.raises(ValueError):
+        gf.matrix([[1, 2], [3]])
+
+
+def test_arithmetic():
+    for p in [7, 2**61 - 1]:
+        gf = FiniteField(p)
+        a = gf.matrix([[1, 2], [3, 4]])
+        b = gf.matrix([[0, 1], [1, 0]])
+
+        assert a + b == gf.matrix([[1, 3], [4, 4]])
+        assert a - b == gf.matrix([[1, 1], [2, 4]])
+        assert a * 2 == 2 * a == gf.matrix([[2, 4], [6, 8]])
+        assert a @ b == a * b == gf.matrix([[2, 1], [4, 3]])
+        assert (a @ gf.matrix([[1], [1]])).shape == (2, 1)
+
+        with pytest.raises(ValueError):
+            a @ gf.matrix([[1, 2, 3]])
+
+
+def test_product_matches_scalar_path():
+    for p in [2, 2**31 - 1, 2**61 - 1]:
+        gf = FiniteField(p)
+        a, b = random_matrix(gf, 5, 40), random_matrix(gf, 40, 3)
+        expected = [
+            [sum((x * y for x, y in zip(row, col)), gf(0)) for col in zip(*b.to_list())]
+            for row in a.to_list()
+        ]
+        assert a @ b == expected
+
+
+def test_row_reduction():
+    for p in [2, 13, 2**31 - 1, 2**61 - 1]:
+        gf = FiniteField(p)
+        m = random_matrix(gf, 6, 9)
+        rows = m.to_list()
+        rows.append([x + y * 3 for x, y in zip(rows[0], rows[1])])
+        m = gf.matrix(rows)
+
+        reduced, pivots = m.row_reduce()
+        rank = m.rank()
+        assert rank == len(pivots) == reduced.shape[0] <= 6
+        for i, pivot in enumerate(pivots):
+            column = [reduced[k, pivot] for k in range(rank)]
+            assert column == [gf(int(i == k)) for k in range(rank)]
+
+        kernel = m.nullspace()
+        assert kernel.shape == (9 - rank, 9)
+        assert m @ kernel.transpose() == gf.matrix([[0] * (9 - rank)] * 7)
+
+    gf = FiniteField(13)
+    m = gf.matrix([[0, 2, 4, 1], [0, 1, 2, 0], [0, 3, 6, 1]])
+    reduced, pivots = m.row_reduce()
+    assert pivots == [1, 3] and m.rank() == 2
+    assert reduced == gf.matrix([[0, 1, 2, 0], [0, 0, 0, 1]])
+    assert m.nullspace() == gf.matrix([[1, 0, 0, 0], [0, 11, 1, 0]])
+
+
+def test_solve():
+    for p in [3, 2**61 - 1]:
+        gf = FiniteField(p)
+        m = random_matrix(gf, 8, 8)
+        while m.rank() < 8:
+            m = random_matrix(gf, 8, 8)
+        x = [gf(randrange(p)) for _ in range(8)]
+        b = m @ gf.matrix([[c] for c in x])
+
+        assert m.solve([row[0] for row in b.to_list()]) == x
+
+        singular = gf.matrix([[1, 1], [2, 2]])
+        assert singular.solve([1, 2]) == [gf(1), gf(0)]
+        with pytest.raises(ValueError):
+            singular.solve([1, 1])
+
+
+def test_determinant():
+    for p in [5, 2**61 - 1]:
+        gf = FiniteField(p)
+        assert gf.matrix([[0, 1], [1, 0]]).determinant() == gf(-1)
+        assert gf.matrix([[2, 1, 0], [1, 3, 1], [0, 1, 4]]).determinant() == gf(18)
+        assert gf.matrix([[1, 2], [2, 4]]).determinant() == gf(0)
+
+        a, b = random_matrix(gf, 6, 6), random_matrix(gf, 6, 6)
+        assert (a @ b).determinant() == a.determinant() * b.determinant()
+
+        with pytest.raises(ValueError):
+            gf.matrix([[1, 2]]).determinant()
+
+
+def test_large_system():
+    gf = FiniteField(2)
+    m = random_matrix(gf, 400, 400)
+    kernel = m.nullspace()
+    assert kernel.shape[0] == 400 - m.rank()
+    assert m @ kernel.transpose() == gf.matrix([[0] * kernel.shape[0]] * 400)
@@ -1,5 +1,5 @@
 import pytest
-from hyperelliptic import FiniteField
+from hyperelliptic import FiniteField, Registry, factorize
 
 
 def test_constructor():
@@ -41,3 +41,58 @@ def test_to_string():
     gf = FiniteField(11)
 
     assert str(gf) == "Finite Field mod 11"
+
+
+def test_batch_inverse():
+    gf = FiniteField(11)
+
+    elements = [gf(x) for x in range(1, 11)]
+    inverses = gf.batch_inverse(elements)
+
+    assert inverses == [x.inverse() for x in elements]
+    assert gf.batch_inverse([2, 4]) == [gf(6), gf(3)]
+    assert gf.batch_inverse([]) == []
+
+    with pytest.raises(ZeroDivisionError):
+        gf.batch_inverse([gf(3), gf(0)])
+
+
+def test_jacobi_many():
+    gf = FiniteField(11)
+    expected = [gf(x).jacobi() for x in range(11)]
+
+    assert gf.jacobi_many(gf.get_elements()) == expected
+    assert gf.jacobi_many([gf(x) for x in range(11)]) == expected
+    assert expected == [0, 1, -1, 1, 1, 1, -1, -1, -1, 1, -1]
+
+    big = FiniteField(2**127 - 1)
+    assert big.jacobi_many([3, 0, -1]) == [big(3).jacobi(), 0, -1]
+
+
+def test_interning():
+    gf = FiniteField.get(11)
+
+    assert FiniteField.get(11) is gf
+    assert FiniteField.get(13) is not gf
+    assert gf.order_factors() == {2: 1, 5: 1}
+
+    p = 2**127 - 1
+    known = factorize(p - 1)
+    assert FiniteField(p).order_factors(known) == known
+    with pytest.raises(ValueError):
+        FiniteField(p).order_factors({2: 1, (p - 1) // 2: 1})
+
+    with pytest.raises(ValueError):
+        FiniteField.get(12)
+
+
+def test_registry_is_bounded():
+    registry = Registry(maxsize=2)
+
+    a = registry.get(1, lambda: object())
+    registry.get(2, lambda: object())
+    assert registry.get(1, lambda: object()) is a
+
+    registry.get(3, lambda: object())
+    assert len(registry) == 2
+    assert 1 in registry and 3 in registry and 2 not in registry
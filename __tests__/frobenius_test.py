@@ -0,0 +1,61 @@
+from itertools import product
+from random import randrange
+from hyperelliptic import FiniteField, FrobeniusContext
+
+
+def test_frobenius_powers():
+    for p in [5, 2**61 - 1]:
+        gf = FiniteField(p)
+        f = gf.poly([1] + [randrange(p) for _ in range(12)])
+        frobenius = FrobeniusContext(f)
+        x = gf.poly([1, 0])
+        g = gf.poly([randrange(p) for _ in range(20)])
+
+        assert frobenius.xq == pow(x, p, f)
+        assert frobenius.frobenius(g) == pow(g, p, f)
+        assert frobenius.frobenius(g, 3) == pow(g, p**3, f)
+        assert list(frobenius.x_powers(2)) == [pow(x, p, f), pow(x, p**2, f)]
+
+        powers = list(frobenius.x_powers(13))
+        for k in [1, 2, 5, 8, 13]:
+            assert frobenius.x_power(k) == powers[k - 1]
+        assert frobenius.x_power(0) == x
+
+
+def test_frobenius_over_extension_field():
+    base = FiniteField(3)
+    gf = base.extension(base.poly([1, 0, 1]))
+    f = gf.poly([[1], [1, 2], [0], [2, 2]])
+    g = gf.poly([[1, 1], [2], [0, 1], [1, 0], [2]])
+
+    assert FrobeniusContext(f).frobenius(g) == pow(g, 9, f)
+    assert FrobeniusContext(f).x_power(3) == pow(gf.poly([1, 0]), 9**3, f)
+
+
+def test_distinct_degree_factors():
+    gf = FiniteField(13)
+    linear = gf.poly([1, 4]) * gf.poly([1, 7])
+    quadratic = gf.poly([1, 0, 2])
+    cubic = gf.poly([1, 0, 1, 7])
+    assert quadratic.is_irreducible() and cubic.is_irreducible()
+
+    factors = (linear * quadratic * cubic).distinct_degree_factors()
+    assert factors == [(linear, 1), (quadratic, 2), (cubic, 3)]
+    assert (linear * quadratic).distinct_degree_factors() == [
+        (linear, 1),
+        (quadratic, 2),
+    ]
+
+
+def test_irreducible_count():
+    # Number of monic irreducible polynomials of degree 4 over GF(3) is 18
+    gf = FiniteField(3)
+    polys = [gf.poly([1] + list(c)) for c in product(range(3), repeat=4)]
+    assert sum(poly.is_irreducible() for poly in polys) == 18
+
+    # Number of monic irreducible polynomials of degree 3 over GF(4) is 20
+    base = FiniteField(2)
+    gf = base.extension(base.poly([1, 1, 1]))
+    elements = [gf.element([a, b]) for a in range(2) for b in range(2)]
+    polys = [gf.poly([gf.one(), *c]) for c in product(elements, repeat=3)]
+    assert sum(poly.is_irreducible() for poly in polys) == 20
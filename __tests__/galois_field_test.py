@@ -1,5 +1,5 @@
 import pytest
-from hyperelliptic import FiniteField
+from hyperelliptic import FiniteField, GaloisField
 
 
 def test_constructor():
@@ -49,3 +49,83 @@ def test_to_string():
     gf = gf.extension(poly)
 
     assert str(gf) == "Galois Field mod 11 mod x^2 + 3x + 3"
+
+
+def test_batch_inverse():
+    gf = FiniteField(11)
+    gf = gf.extension(gf.poly([1, 3, 3]))
+
+    elements = [gf.element([1, 5]), gf.element([3]), gf.element([7, 0])]
+    inverses = gf.batch_inverse(elements)
+
+    assert inverses == [x.inverse() for x in elements]
+    assert all(x * y == gf.one() for x, y in zip(elements, inverses))
+
+    with pytest.raises(ZeroDivisionError):
+        gf.batch_inverse([gf.one(), gf.zero()])
+
+
+def test_log_tables():
+    base = FiniteField(11)
+    poly = base.poly([1, 3, 3])
+    gf = base.extension(poly)
+    gf_tables = base.extension(poly, tables=True)
+
+    elements = [gf.element([a, b]) for a in range(11) for b in range(11)]
+    table_elements = [gf_tables.element([a, b]) for a in range(11) for b in range(11)]
+
+    for x, tx in zip(elements[::7], table_elements[::7]):
+        for y, ty in zip(elements, table_elements):
+            assert (tx * ty).coeff == (x * y).coeff
+        assert (tx**5).coeff == (x**5).coeff
+        assert tx.is_quadratic_residue() == x.is_quadratic_residue()
+        if x != gf.zero():
+            assert tx.inverse().coeff == x.inverse().coeff
+        if x.is_quadratic_residue():
+            assert tx.sqrt() ** 2 == tx
+
+    assert gf_tables.tables.generator ** (gf.q - 1) == gf_tables.one()
+
+
+def test_log_tables_char_2():
+    base = FiniteField(2)
+    gf = base.extension(base.poly([1, 0, 0, 1, 0, 1]), tables=True)
+
+    p1 = gf.element([1, 0, 1, 0, 0])
+    assert p1.inverse() == gf.element([1, 1, 1, 1, 0])
+    assert p1 * gf.element([1, 0]) == gf.element([1, 1, 0, 1])
+    assert p1.sqrt() ** 2 == p1
+
+    with pytest.raises(ZeroDivisionError):
+        gf.zero().inverse()
+
+
+def test_log_tables_curve():
+    gf = FiniteField(11)
+    gf = gf.extension(gf.poly([1, 3, 3]), tables=True)
+
+    f = gf.poly([1, 0, 3, 7, 1, 2])
+    h = gf.poly([0])
+    c = gf.hyperelliptic(h, f)
+
+    assert len(c.get_all_points()) == 147
+
+
+def test_log_tables_size_limit():
+    gf = FiniteField(1031)
+
+    with pytest.raises(ValueError):
+        gf.extension(gf.rand_irreducible_poly(2), tables=True)
+
+
+def test_interning():
+    base = FiniteField.get(11)
+    gf = GaloisField.get(base, base.poly([1, 3, 3]))
+
+    assert GaloisField.get(base, base.poly([1, 3, 3])) is gf
+    assert GaloisField.get(FiniteField(11), base.poly([1, 3, 3])) is gf
+    assert GaloisField.get(base, base.poly([1, 3, 3]), tables=True) is not gf
+    assert gf.order_factors() == {2: 3, 3: 1, 5: 1}
+
+    with pytest.raises(ValueError):
+        GaloisField.get(base, base.poly([1, 0, 10]))
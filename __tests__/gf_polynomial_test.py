@@ -138,3 +138,18 @@ def test_sqrt():
     assert b**2 == a
     assert (-b) ** 2 == a
     assert gf.zero().sqrt() == gf.zero()
+
+
+def test_sqrt_all_residue_classes():
+    # q = 9 (1 mod 8), q = 125 (5 mod 8), q = 49 (1 mod 8 with s = 4)
+    for p, poly in [(3, [1, 0, 1]), (5, [1, 0, 3, 3]), (7, [1, 0, 1])]:
+        base = FiniteField(p)
+        gf = base.extension(base.poly(poly))
+
+        for _ in range(20):
+            x = gf.rand_element()
+            root = x.try_sqrt()
+            if x.is_quadratic_residue():
+                assert root**2 == x
+            else:
+                assert root is None
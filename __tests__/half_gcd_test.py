@@ -0,0 +1,50 @@
+from random import randrange
+from hyperelliptic import FiniteField
+import hyperelliptic.half_gcd as half_gcd
+
+
+def random_poly(p, size):
+    return [randrange(1, p)] + [randrange(p) for _ in range(size - 1)]
+
+
+def test_half_gcd_matrix(monkeypatch):
+    monkeypatch.setattr(half_gcd, "CLASSICAL_THRESHOLD", 4)
+    ctx = FiniteField(101).ctx
+    a, b = random_poly(101, 81), random_poly(101, 60)
+
+    m00, m01, m10, m11 = half_gcd.half_gcd(ctx, a, b)
+    c = ctx.poly_add(ctx.poly_mul(m00, a), ctx.poly_mul(m01, b))
+    d = ctx.poly_add(ctx.poly_mul(m10, a), ctx.poly_mul(m11, b))
+    assert len(c) - 1 >= 40 > len(d) - 1
+
+
+def test_matches_classical_xgcd(monkeypatch):
+    monkeypatch.setattr(half_gcd, "CLASSICAL_THRESHOLD", 4)
+    for p in [2, 3, 2**61 - 1]:
+        ctx = FiniteField(p).ctx
+        common = random_poly(p, 12)
+        for la, lb in [(5, 90), (90, 90), (150, 37)]:
+            a = ctx.poly_mul(common, random_poly(p, la))
+            b = ctx.poly_mul(common, random_poly(p, lb))
+
+            monkeypatch.setattr(ctx, "HGCD_THRESHOLD", 10**6)
+            expected = ctx.poly_xgcd(a, b)
+            monkeypatch.setattr(ctx, "HGCD_THRESHOLD", 1)
+            g, s, t = ctx.poly_xgcd(a, b)
+
+            assert (g, s, t) == expected
+            assert ctx.poly_add(ctx.poly_mul(s, a), ctx.poly_mul(t, b)) == g
+            assert ctx.poly_gcd(a, b) == g
+            assert ctx.poly_mod(g, common) == [0]
+
+
+def test_polynomials_use_half_gcd(monkeypatch):
+    gf = FiniteField(13)
+    monkeypatch.setattr(gf.ctx, "HGCD_THRESHOLD", 8)
+    p1 = gf.poly(random_poly(13, 30)) * gf.poly([1, 2, 3])
+    p2 = gf.poly(random_poly(13, 25)) * gf.poly([1, 2, 3])
+
+    d, a, b = p1.xgcd(p2)
+    assert d == p1.gcd(p2)
+    assert a * p1 + b * p2 == d
+    assert d % gf.poly([1, 2, 3]) == gf.poly([0])
@@ -133,3 +133,20 @@ def test_repr():
     assert repr(gf(10)) == "10"
     assert repr(gf(7)) == "7"
     assert repr(gf(5)) == "5"
+
+
+def test_sqrt_all_residue_classes():
+    # p = 3 mod 4, p = 5 mod 8 and p = 1 mod 8 use different formulas
+    for p in [7, 13, 17, 41, 97, 2]:
+        gf = FiniteField(p)
+        squares = {(x * x) % p for x in range(p)}
+
+        for x in range(p):
+            root = gf(x).try_sqrt()
+            if x in squares:
+                assert root**2 == x
+                assert gf(x).sqrt() ** 2 == x
+            else:
+                assert root is None
+                with pytest.raises(ValueError):
+                    gf(x).sqrt()
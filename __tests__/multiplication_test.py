@@ -0,0 +1,63 @@
+from random import randint
+from hyperelliptic import FiniteField, Polynomial, RingPolynomial
+from hyperelliptic.multiplication import karatsuba_le, multiply, schoolbook_le, toom3_le
+
+
+def schoolbook(a, b, zero=0):
+    return schoolbook_le(a[::-1], b[::-1], zero)[::-1]
+
+
+def test_karatsuba():
+    for la, lb in [(1, 1), (7, 7), (20, 33), (64, 64), (3, 50), (50, 3)]:
+        a = [randint(-50, 50) for _ in range(la)]
+        b = [randint(-50, 50) for _ in range(lb)]
+        result = karatsuba_le(a[::-1], b[::-1], 0, threshold=2)[::-1]
+        assert result == schoolbook(a, b)
+
+
+def test_toom3():
+    exact_div = lambda c, k: c // k
+    for la, lb in [(9, 9), (30, 30), (81, 40), (100, 7), (5, 100)]:
+        a = [randint(-50, 50) for _ in range(la)]
+        b = [randint(-50, 50) for _ in range(lb)]
+        result = toom3_le(a[::-1], b[::-1], 0, exact_div, 3, 2)[::-1]
+        assert result == schoolbook(a, b)
+        assert multiply(a, b, 0, exact_div, 2, 3) == schoolbook(a, b)
+
+
+def test_integer_polynomial_thresholds(monkeypatch):
+    monkeypatch.setattr(Polynomial, "KARATSUBA_THRESHOLD", 2)
+    monkeypatch.setattr(Polynomial, "TOOM3_THRESHOLD", 3)
+
+    p1 = Polynomial([1, 0, 1, 8, 9, 7])
+    p2 = Polynomial([1, 0, 3, 4])
+    assert p1 * p2 == Polynomial([1, 0, 4, 12, 12, 35, 59, 57, 28])
+
+    a = [randint(-99, 99) for _ in range(40)]
+    b = [randint(-99, 99) for _ in range(27)]
+    assert (Polynomial(a) * Polynomial(b)).coeff == schoolbook(a, b)
+
+
+def test_prime_field_thresholds(monkeypatch):
+    gf = FiniteField(11)
+    monkeypatch.setattr(gf.ctx, "KARATSUBA_THRESHOLD", 2)
+    monkeypatch.setattr(gf.ctx, "TOOM3_THRESHOLD", 3)
+
+    a = [randint(0, 10) for _ in range(40)]
+    b = [randint(0, 10) for _ in range(27)]
+    expected = gf.poly([c % 11 for c in schoolbook(a, b)])
+    assert gf.poly(a) * gf.poly(b) == expected
+
+
+def test_extension_field_thresholds(monkeypatch):
+    monkeypatch.setattr(Polynomial, "KARATSUBA_THRESHOLD", 2)
+    monkeypatch.setattr(Polynomial, "TOOM3_THRESHOLD", 3)
+
+    for p, modulus in [(2, [1, 1, 1]), (3, [1, 0, 1]), (7, [1, 0, 1])]:
+        base = FiniteField(p)
+        gf = base.extension(base.poly(modulus))
+        a = [[randint(0, p - 1), randint(0, p - 1)] for _ in range(20)]
+        b = [[randint(0, p - 1), randint(0, p - 1)] for _ in range(13)]
+        elements = lambda coeff: [gf.element(c) for c in coeff]
+        expected = schoolbook(elements(a), elements(b), gf.zero())
+        assert gf.poly(a) * gf.poly(b) == RingPolynomial(gf, expected)
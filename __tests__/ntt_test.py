@@ -0,0 +1,40 @@
+from random import randrange
+import pytest
+from hyperelliptic import FiniteField, ntt_multiply, ntt_supported
+
+np = pytest.importorskip("numpy")
+
+
+def random_poly(p, size):
+    return [randrange(1, p)] + [randrange(p) for _ in range(size - 1)]
+
+
+def test_ntt_friendly_prime():
+    p = 998244353
+    ctx = FiniteField(p).ctx
+    a, b = random_poly(p, 300), random_poly(p, 170)
+
+    assert ntt_multiply(a, b, p) == ctx.poly_mul(a, b)
+    assert ntt_multiply(a, a, p) == ctx.poly_sqr(a)
+    assert ntt_multiply([3], [5], p) == [15]
+
+
+def test_arbitrary_primes():
+    for p in [2, 3, 11, 2**61 - 1, 2**127 - 1]:
+        ctx = FiniteField(p).ctx
+        a, b = random_poly(p, 200), random_poly(p, 129)
+
+        assert ntt_multiply(a, b, p) == ctx.poly_mul(a, b)
+        assert ntt_multiply(b, b, p) == ctx.poly_sqr(b)
+
+
+def test_selected_above_threshold(monkeypatch):
+    gf = FiniteField(2**31 - 1)
+    p1 = gf.poly(random_poly(gf.p, 40))
+    p2 = gf.poly(random_poly(gf.p, 33))
+    expected = p1 * p2
+
+    monkeypatch.setattr(gf.ctx, "NTT_THRESHOLD", 16)
+    assert ntt_supported(gf.p, 72)
+    assert p1 * p2 == expected
+    assert p1**2 == p1 * gf.poly(p1.coeff)
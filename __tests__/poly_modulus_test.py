@@ -0,0 +1,61 @@
+from random import randrange
+import pytest
+from hyperelliptic import FiniteField, PolyModulus, Polynomial
+
+
+def random_poly(gf, size):
+    return gf.poly([randrange(1, gf.p)] + [randrange(gf.p) for _ in range(size - 1)])
+
+
+def test_dense_modulus():
+    for p in [2, 13, 2**61 - 1]:
+        gf = FiniteField(p)
+        for deg in [3, 40, 70]:
+            modulus = random_poly(gf, deg + 1)
+            reducer = PolyModulus(modulus)
+            for size in [1, deg, deg + 1, 2 * deg - 1, 5 * deg]:
+                poly = random_poly(gf, size)
+                assert reducer.reduce(poly) == poly % modulus
+
+
+def test_sparse_modulus():
+    gf = FiniteField(2)
+    trinomial = gf.poly([1] + [0] * 56 + [1, 0, 0, 0, 0, 0, 1])
+    pentanomial = gf.poly([1] + [0] * 59 + [1, 1, 0, 1, 1])
+
+    for modulus in [trinomial, pentanomial]:
+        poly = random_poly(gf, 150)
+        assert PolyModulus(modulus).reduce(poly) == poly % modulus
+
+    gf = FiniteField(13)
+    modulus = gf.poly([5, 0, 0, 0, 0, 0, 2, 3])
+    poly = random_poly(gf, 30)
+    assert PolyModulus(modulus).reduce(poly) == poly % modulus
+
+
+def test_generic_coefficients():
+    modulus = Polynomial([1, 0, 3, 4])
+    poly = Polynomial([1, 0, 1, 8, 9, 7])
+    assert PolyModulus(modulus).reduce(poly) == Polynomial([4, 15, 15])
+
+    with pytest.raises(ValueError):
+        PolyModulus(Polynomial([3]))
+
+
+def test_modular_exponentiation():
+    gf = FiniteField(101)
+    modulus = random_poly(gf, 50)
+    poly = random_poly(gf, 30)
+
+    expected = gf.poly([1])
+    for _ in range(11):
+        expected = expected * poly % modulus
+    assert pow(poly, 11, modulus) == expected
+    assert pow(poly, 11, PolyModulus(modulus)) == expected
+
+
+def test_galois_field_modulus():
+    base = FiniteField(7)
+    gf = base.extension(base.poly([1, 0, 1]))
+    assert gf.modulus.modulus == base.poly([1, 0, 1])
+    assert gf.element([1, 0, 0]) == gf.element([6])
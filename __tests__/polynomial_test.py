@@ -41,6 +41,11 @@ def test_division():
     assert p3 // p4 == Polynomial([1, 0, -2])
     assert p3 % p4 == Polynomial([4, 15, 15])
 
+    p5 = Polynomial([2, 0, 4, 6])
+    p6 = Polynomial([2, 2])
+    assert divmod(p5, p6) == (Polynomial([1, -1, 3]), Polynomial([0]))
+    assert p3 % p6 == Polynomial([4])
+
 
 def test_comparison():
     p1 = Polynomial([1, 0, 10])
@@ -102,3 +107,10 @@ def test_gcd():
 
     assert p1.gcd(p2) == Polynomial([1, 1])
     assert p3.gcd(p4) == p4
+
+
+def test_evaluation():
+    p1 = Polynomial([1, 0, 3, 4])
+    assert p1(0) == 4 and p1(2) == 18 and p1(-1) == 0
+    assert Polynomial([7])(5) == 7
+    assert p1(0.5) == 5.625
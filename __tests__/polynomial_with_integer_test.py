@@ -1,5 +1,5 @@
 import pytest
-from hyperelliptic import FiniteField
+from hyperelliptic import FiniteField, Polynomial
 
 
 def test_division():
@@ -18,3 +18,14 @@ def test_multiplication():
 
     with pytest.raises(ZeroDivisionError):
         p / gf.zero()
+
+
+def test_multiplication_in_small_characteristic():
+    # Toom-3 divides by 2 and 3, so it must not be used over GF(2) and GF(3)
+    for p in [2, 3]:
+        gf = FiniteField(p)
+        a = Polynomial([gf(1)] * 100)
+        b = Polynomial([gf(1), gf(0)] * 50)
+        expected = gf.poly([1] * 100) * gf.poly([1, 0] * 50)
+        assert (a * b).coeff == expected.coeff
+        assert (a * a).coeff == (gf.poly([1] * 100) ** 2).coeff
@@ -0,0 +1,36 @@
+from itertools import islice
+
+from hyperelliptic.primes import primes_up_to, iter_primes, next_prime
+
+PRIMES_BELOW_100 = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+PRIMES_BELOW_100 += [53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+
+def test_primes_up_to():
+    assert primes_up_to(1) == []
+    assert primes_up_to(2) == [2]
+    assert primes_up_to(100) == PRIMES_BELOW_100
+    assert primes_up_to(97) == PRIMES_BELOW_100
+    assert len(primes_up_to(10**6)) == 78498
+
+
+def test_iter_primes():
+    assert list(iter_primes(0, 100)) == PRIMES_BELOW_100
+    assert list(iter_primes(50, 60)) == [53, 59]
+    assert list(islice(iter_primes(), 25)) == PRIMES_BELOW_100
+
+    # Segments beyond the cache are sieved lazily
+    assert list(iter_primes(10**12, 10**12 + 70)) == [
+        1000000000039,
+        1000000000061,
+        1000000000063,
+    ]
+    assert next(iter_primes(2**45)) == 35184372088891
+
+
+def test_next_prime():
+    assert next_prime(0) == 2
+    assert next_prime(2) == 3
+    assert next_prime(89) == 97
+    assert next_prime(10**12) == 1000000000039
+    assert next_prime(2**127 - 2) == 2**127 - 1
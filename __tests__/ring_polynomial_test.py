@@ -81,6 +81,20 @@ def test_division():
         p3 % gf.poly([gf.zero()])
 
 
+def test_division_over_extension_field():
+    base = FiniteField(7)
+    gf = base.extension(base.poly([1, 0, 1]))
+
+    p1 = gf.poly([[1, 2], [3], [0], [5, 1], [6, 6]])
+    p2 = gf.poly([[2, 3], [1], [4, 4]])
+    q, r = divmod(p1, p2)
+
+    assert r.deg < p2.deg
+    assert q * p2 + r == p1
+    assert p1 // p2 == q and p1 % p2 == r
+    assert p1 % p2.to_monic() == r
+
+
 def test_comparison():
     gf = FiniteField(11)
 
@@ -169,6 +183,12 @@ def test_factorization():
     assert p2_multiplicity == 2
     assert len(p3.factors()) == 2 and gf.poly([1, 6]) in p3.factors()
 
+    gf = FiniteField(2)
+    p = gf.poly([1, 1]) ** 2 * gf.poly([1, 1, 1]) ** 3 * gf.poly([1, 0])
+    factors = p.factors()
+    assert len(factors) == 6 and factors.count(gf.poly([1, 1, 1])) == 3
+    assert factors.count(gf.poly([1, 1])) == 2 and gf.poly([1, 0]) in factors
+
 
 def test_irreducibility():
     gf = FiniteField(2)
@@ -185,3 +205,78 @@ def test_irreducibility():
     gf = FiniteField(7)
     poly = gf.poly([1, 6, 1, 3, 0, 6, 5])
     assert poly.is_irreducible() == False
+
+
+def test_dense_representation():
+    gf = FiniteField(11)
+    p1 = gf.poly([0, 1, 0, 13, 9])
+
+    assert p1._to_ints() == [1, 0, 2, 9]
+    assert p1.coeff == [gf(1), gf(0), gf(2), gf(9)]
+    assert p1.deg == 3 and p1.leading_coeff == gf(1)
+    assert (p1 * p1)._to_ints() == [1, 0, 4, 7, 4, 3, 4]
+    assert gf.poly([gf(0), 12]) == 1 and gf.poly([0]) == 0
+
+    big = FiniteField(2**89 - 1)
+    p2 = big.poly([2**88, 2**89])
+    assert p2._to_ints() == [2**88, 1]
+    assert p2 * p2 == big.poly([2**176, 2**89, 1])
+
+    base = FiniteField(7)
+    ext = base.extension(base.poly([1, 0, 1]))
+    p3 = ext.poly([[1, 2], [3]])
+    assert p3._int_ctx() is None and p3.coeff == [ext.element([1, 2]), ext(3)]
+
+
+def test_roots():
+    gf = FiniteField(11)
+    poly = gf.poly([1, 4]) ** 2 * gf.poly([1, 3]) * gf.poly([1, 0, 1])
+    assert sorted(r.value for r in poly.roots()) == [7, 7, 8]
+    assert gf.poly([1, 0, 1]).roots() == []
+    assert gf.poly([5]).roots() == []
+
+    gf = FiniteField(2)
+    assert sorted(r.value for r in gf.poly([1, 1, 0]).roots()) == [0, 1]
+    assert gf.poly([1, 1, 1]).roots() == []
+
+    base = FiniteField(3)
+    ext = base.extension(base.poly([1, 0, 1]))
+    a = ext.element([1, 0])
+    poly = ext.poly([1, 0, 1]) * ext.poly([ext.one(), a + 1]) ** 2
+    roots = poly.roots()
+    assert len(roots) == 4
+    assert roots.count(-(a + 1)) == 2 and a in roots and -a in roots
+
+    base = FiniteField(2)
+    ext = base.extension(base.poly([1, 0, 0, 1, 1]))
+    elements = [ext.element([1, 1, 0, 1]), ext.element([0, 1, 0, 1]), ext.one()]
+    poly = ext.poly([1])
+    for e in elements + elements[:1]:
+        poly *= ext.poly([ext.one(), e])
+    roots = poly.roots()
+    assert len(roots) == 4 and roots.count(elements[0]) == 2
+    assert all(e in roots for e in elements)
+
+
+def test_equal_degree_factors():
+    # -1 is quadratic non-residue modulo 2^127 - 1, so x^2 + k^2 are irreducible
+    gf = FiniteField(2**127 - 1)
+    quadratics = [gf.poly([1, 0, 1]), gf.poly([1, 0, 4]), gf.poly([1, 0, 9])]
+    poly = quadratics[0] * quadratics[1] * quadratics[2]
+    factors = poly.equal_degree_factors(2)
+    assert len(factors) == 3 and all(q in factors for q in quadratics)
+
+    base = FiniteField(2)
+    ext = base.extension(base.poly([1, 0, 0, 1, 1]))
+    candidates = [
+        ext.poly([ext.one(), ext.element(a), ext.element(b)])
+        for a in ([1], [1, 0], [1, 1])
+        for b in ([1], [1, 0], [1, 0, 0], [1, 1, 1])
+    ]
+    quadratics = [q for q in candidates if q.is_irreducible()][:3]
+    poly = quadratics[0] * quadratics[1] * quadratics[2]
+    factors = poly.equal_degree_factors(2)
+    assert len(factors) == 3 and all(q in factors for q in quadratics)
+
+    linear = ext.poly([ext.one(), ext.one()])
+    assert linear.equal_degree_factors(1) == [linear]
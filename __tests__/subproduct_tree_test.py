@@ -0,0 +1,37 @@
+from random import randrange
+import pytest
+from hyperelliptic import FiniteField, Polynomial, SubproductTree
+import hyperelliptic.subproduct_tree as subproduct_tree
+
+
+def test_tree_structure():
+    ctx = FiniteField(11).ctx
+    tree = SubproductTree(ctx, [1, 2, 3])
+
+    assert tree.levels[0] == [[1, 10], [1, 9], [1, 8]]
+    assert tree.levels[1] == [[1, 8, 2], [1, 8]]
+    assert tree.root == [1, 5, 0, 5]
+
+    with pytest.raises(ValueError):
+        SubproductTree(ctx, [])
+
+
+def test_evaluate(monkeypatch):
+    monkeypatch.setattr(subproduct_tree, "LEAF_SIZE", 2)
+    for p in [2, 101, 2**61 - 1]:
+        ctx = FiniteField(p).ctx
+        a = [randrange(1, p)] + [randrange(p) for _ in range(80)]
+        points = [randrange(p) for _ in range(100)]
+
+        values = SubproductTree(ctx, points).evaluate(a)
+        assert values == [ctx.poly_eval(a, x) for x in points]
+
+
+def test_evaluate_many(monkeypatch):
+    monkeypatch.setattr("hyperelliptic.polynomial.SUBPRODUCT_THRESHOLD", 4)
+    gf = FiniteField(10007)
+    poly = gf.poly([randrange(1, 10007)] + [randrange(10007) for _ in range(40)])
+    xs = list(range(200)) + [gf(5), gf(10006)]
+
+    assert poly.evaluate_many(xs) == [poly(x) for x in xs]
+    assert Polynomial([1, 0, 3, 4]).evaluate_many([0, 1, 2]) == [4, 8, 18]
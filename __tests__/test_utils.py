@@ -1,5 +1,5 @@
 import pytest
-from hyperelliptic import factors, all_factors
+from hyperelliptic import factors, all_factors, jacobi
 
 
 def test_factorization():
@@ -28,9 +28,15 @@ def test_factorization():
     assert all(f in expected_2401_factors for f in factors_2401)
     assert len(factors_2401) == len(expected_2401_factors)
 
-    too_big_to_factor = 728332861387732709516448268243094614312200863702341084222464
+    beyond_smoothness_bound = (
+        728332861387732709516448268243094614312200863702341084222464
+    )
+    expected_big_factors = [2] * 10 + [3, 13, 181, 5221747087, 2834768083765327]
+    expected_big_factors += [6806963142408974853881955271]
+    assert factors(beyond_smoothness_bound) == expected_big_factors
+
     with pytest.raises(ValueError):
-        factors(too_big_to_factor)
+        factors(0)
 
 
 def test_all_factors():
@@ -58,3 +64,18 @@ def test_all_factors():
     factors_2401 = all_factors(2401)
     assert all(f in expected_2401_factors for f in factors_2401)
     assert len(factors_2401) == len(expected_2401_factors)
+
+
+def test_jacobi():
+    for n in [3, 5, 7, 11, 13, 97, 1009]:
+        for a in range(-5, 2 * n):
+            expected = pow(a, (n - 1) // 2, n)
+            expected = -1 if expected == n - 1 else expected
+            assert jacobi(a, n) == expected
+
+    # Composite n, (2/15) = (2/3)(2/5) = 1
+    assert jacobi(2, 15) == 1
+    assert jacobi(5, 15) == 0
+
+    with pytest.raises(ValueError):
+        jacobi(3, 10)
@@ -1,8 +1,22 @@
+from .berlekamp import *
+from .field_array import *
+from .field_context import *
+from .field_matrix import *
+from .factorization import *
 from .finite_field import *
+from .frobenius import *
 from .galois_field import *
+from .genus2 import *
 from .gf_polynomial import *
 from .hyperelliptic import *
 from .integer import *
+from .log_tables import *
+from .multiplication import *
+from .ntt import *
+from .poly_modulus import *
 from .polynomial import *
+from .registry import *
 from .ring_polynomial import *
+from .sqrt_context import *
+from .subproduct_tree import *
 from .utils import *
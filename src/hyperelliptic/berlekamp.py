@@ -0,0 +1,82 @@
+"""(module) containing Berlekamp factorization of polynomials over small prime fields.
+Polynomials are lists ordered from the most significant coefficient and all
+arithmetic is done by FieldContext."""
+
+from .field_context import strip_coeff
+from .field_matrix import FieldMatrix
+from .poly_modulus import PolyModulus
+
+# Berlekamp is used for primes up to this bound, splitting tries all p constants
+MAX_BERLEKAMP_PRIME = 31
+
+# Square-free polynomials of at least this degree are factored with Berlekamp
+BERLEKAMP_THRESHOLD = 8
+
+
+def berlekamp_supported(p: int, deg: int) -> bool:
+    """Check if square-free polynomial of degree deg over prime field
+    of order p should be factored with Berlekamp instead of Cantor-Zassenhaus"""
+    return p <= MAX_BERLEKAMP_PRIME and deg >= BERLEKAMP_THRESHOLD
+
+
+def berlekamp_matrix(gf, f: list[int]) -> FieldMatrix:
+    """Matrix Q - I, where row i holds coefficients of x^(p * i) - x^i mod f
+    ordered from the constant term"""
+    ctx = gf.ctx
+    n = len(f) - 1
+    reducer = PolyModulus.from_ints(ctx, f)
+
+    # x^p mod f by repeated squaring, multiplication by x is a shift
+    xp = [1]
+    for bit in bin(ctx.p)[2:]:
+        xp = reducer.reduce_ints(ctx.poly_sqr(xp))
+        if bit == "1":
+            xp = reducer.reduce_ints(xp + [0])
+
+    rows, power = [], [1]
+    for i in range(n):
+        row = power[::-1] + [0] * (n - len(power))
+        row[i] = (row[i] - 1) % ctx.p
+        rows.append(row)
+        power = reducer.reduce_ints(ctx.poly_mul(power, xp))
+    return FieldMatrix(gf, rows)
+
+
+def berlekamp_factors(gf, f: list[int]) -> list[list[int]]:
+    """Irreducible factors of monic square-free polynomial f over prime field.
+    Each vector g of Berlekamp subalgebra (g^p = g mod f) splits f into
+    gcd(f, g - s) for s < p."""
+    ctx = gf.ctx
+    p = ctx.p
+    n = len(f) - 1
+    if n <= 1:
+        return [f]
+
+    # Rows of Q - I combined to zero give the subalgebra, so transpose first
+    # pylint: disable=protected-access
+    basis = berlekamp_matrix(gf, f).transpose().nullspace()._int_rows()
+    count = len(basis)
+
+    factors = [f]
+    for v in basis:
+        g = strip_coeff(v[::-1])
+        if len(g) == 1:
+            continue
+        result = []
+        for h in factors:
+            if len(h) == 2:
+                result.append(h)
+                continue
+            r = ctx.poly_mod(g, h)
+            found = 0
+            for s in range(p):
+                if found == len(h) - 1:
+                    break
+                d = ctx.poly_gcd(h, ctx.poly_sub(r, [s]))
+                if len(d) > 1:
+                    result.append(d)
+                    found += len(d) - 1
+        factors = result
+        if len(factors) == count:
+            break
+    return factors
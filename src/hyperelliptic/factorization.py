@@ -0,0 +1,296 @@
+"""(module) containing integer factorization engine"""
+
+from math import gcd
+from random import randrange
+
+from .utils import is_prime
+from .primes import iter_primes, next_prime, primes_up_to
+
+# Primes below this bound are removed by trial division
+TRIAL_DIVISION_BOUND = 2**12
+
+# Stage bounds and number of curves of Lenstra's ECM attempts,
+# the search for a factor escalates through consecutive rows.
+ECM_SCHEDULE = [
+    (2_000, 25),
+    (11_000, 90),
+    (50_000, 300),
+    (250_000, 700),
+]
+
+
+def _max_power(p: int, bound: int) -> int:
+    """Largest power of p not exceeding bound"""
+    power = p
+    while power * p <= bound:
+        power *= p
+    return power
+
+
+def _integer_root(n: int, k: int) -> int:
+    """Largest integer r such that r^k <= n"""
+    r = 1 << ((n.bit_length() + k - 1) // k)
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            return r
+        r = s
+
+
+def _perfect_power(n: int) -> tuple[int, int]:
+    """Returns (r, k) such that n = r^k with the largest possible k"""
+    for k in range(n.bit_length(), 1, -1):
+        r = _integer_root(n, k)
+        if r > 1 and r**k == n:
+            return r, k
+    return n, 1
+
+
+def trial_division(n: int, bound: int = TRIAL_DIVISION_BOUND):
+    """Remove prime factors below bound. Returns ({prime: exponent}, cofactor)"""
+    result = {}
+    for p in iter_primes(2, bound):
+        if p * p > n:
+            break
+        while n % p == 0:
+            result[p] = result.get(p, 0) + 1
+            n //= p
+    if 1 < n < bound * bound:
+        result[n] = result.get(n, 0) + 1
+        n = 1
+    return result, n
+
+
+def pollard_rho_brent(n: int, max_iterations: int = 2**20) -> int | None:
+    """Brent's variant of Pollard's rho. Returns non-trivial factor of n or None"""
+    if n % 2 == 0:
+        return 2
+
+    y, c, m = randrange(1, n), randrange(1, n), 128
+    g, r, q = 1, 1, 1
+    x = ys = y
+
+    while g == 1 and r <= max_iterations:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += m
+        r *= 2
+
+    if g == n:
+        # Products collapsed, repeat the last block step by step
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+
+    return g if 1 < g < n else None
+
+
+def pollard_pm1(n: int, b1: int = 10_000, b2: int = 500_000) -> int | None:
+    """Pollard's p - 1 with prime-by-prime stage 2. Returns factor of n or None"""
+    a = 2
+    for p in iter_primes(2, b1 + 1):
+        a = pow(a, _max_power(p, b1), n)
+
+    g = gcd(a - 1, n)
+    if 1 < g < n:
+        return g
+    if g == n:
+        return None
+
+    # Stage 2 finds factors q for which q - 1 is b1-smooth except one prime <= b2
+    gaps = {}
+    x, prev, acc = 1, 0, 1
+    for p in iter_primes(b1 + 1, b2 + 1):
+        gap = p - prev
+        if gap not in gaps:
+            gaps[gap] = pow(a, gap, n)
+        x = x * gaps[gap] % n
+        acc = acc * (x - 1) % n
+        prev = p
+
+    g = gcd(acc, n)
+    return g if 1 < g < n else None
+
+
+def _ecm_add(p, q, diff, n):
+    # Differential addition on Montgomery curve in (X : Z) coordinates
+    u = (p[0] - p[1]) * (q[0] + q[1])
+    v = (p[0] + p[1]) * (q[0] - q[1])
+    return diff[1] * (u + v) ** 2 % n, diff[0] * (u - v) ** 2 % n
+
+
+def _ecm_double(p, a24, n):
+    s = (p[0] + p[1]) ** 2
+    d = (p[0] - p[1]) ** 2
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _ecm_mul(p, k, a24, n):
+    # Montgomery ladder
+    r0, r1 = p, _ecm_double(p, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            r0, r1 = _ecm_add(r1, r0, p, n), _ecm_double(r1, a24, n)
+        else:
+            r0, r1 = _ecm_double(r0, a24, n), _ecm_add(r1, r0, p, n)
+    return r0
+
+
+def ecm(n: int, b1: int = 2_000, curves: int = 25, b2: int | None = None):
+    """Lenstra's elliptic curve method on Montgomery curves with Suyama's
+    parametrization. Returns non-trivial factor of n or None"""
+    if n <= 1:
+        raise ValueError(f"Can not factor {n}")
+    if n < TRIAL_DIVISION_BOUND:
+        # Curves need sigma in [6, n - 2], small n is factored directly
+        factor = min(trial_division(n)[0])
+        return factor if factor < n else None
+
+    b2 = 100 * b1 if b2 is None else b2
+    stage_1 = [_max_power(p, b1) for p in primes_up_to(b1)]
+    d = 2 * 3 * 5 * 7
+
+    for _ in range(curves):
+        sigma = randrange(6, n - 1)
+        u = (sigma * sigma - 5) % n
+        v = 4 * sigma % n
+        x0 = pow(u, 3, n)
+        z0 = pow(v, 3, n)
+        num = pow(v - u, 3, n) * (3 * u + v) % n
+        den = 16 * x0 * v % n
+        g = gcd(den, n)
+        if g != 1:
+            if g < n:
+                return g
+            continue
+        a24 = num * pow(den, -1, n) % n
+
+        q = (x0, z0)
+        for k in stage_1:
+            q = _ecm_mul(q, k, a24, n)
+        g = gcd(q[1], n)
+        if 1 < g < n:
+            return g
+        if g == n or b2 <= b1:
+            continue
+
+        # Stage 2 with baby steps [j]Q for odd j < d / 2 and giant steps [m * d]Q,
+        # prime p = m * d +- j is detected when x-coordinates of both points agree
+        q2 = _ecm_double(q, a24, n)
+        baby = {1: q, 3: _ecm_add(q2, q, q, n)}
+        for j in range(5, d // 2, 2):
+            baby[j] = _ecm_add(baby[j - 2], q2, baby[j - 4], n)
+
+        step = _ecm_mul(q, d, a24, n)
+        m = (next_prime(b1) + d // 2) // d
+        giant = _ecm_mul(q, m * d, a24, n)
+        prev = _ecm_mul(q, (m - 1) * d, a24, n)
+
+        acc = 1
+        for p in iter_primes(b1 + 1, b2 + 1):
+            while p > m * d + d // 2:
+                giant, prev = _ecm_add(giant, step, prev, n), giant
+                m += 1
+            bx, bz = baby[abs(p - m * d)]
+            acc = acc * (giant[0] * bz - bx * giant[1]) % n
+
+        g = gcd(acc, n)
+        if 1 < g < n:
+            return g
+    return None
+
+
+def _find_factor(n: int) -> int:
+    """Non-trivial factor of composite n"""
+    factor = pollard_pm1(n)
+    if factor is not None:
+        return factor
+
+    factor = pollard_rho_brent(n, max_iterations=2**16)
+    if factor is not None:
+        return factor
+
+    for b1, curves in ECM_SCHEDULE:
+        factor = ecm(n, b1, curves)
+        if factor is not None:
+            return factor
+
+    raise ValueError(f"Can not factor {n}")
+
+
+def factorize(n: int) -> dict[int, int]:
+    """Returns factorization of positive integer as a map {prime: exponent}.
+    Small factors are cheap, but the running time grows with the second largest
+    prime factor: a 256-bit n with two cofactors of 80+ bits may take minutes
+    of ECM. Use check_factorization to accept factors known in advance."""
+    if n < 1:
+        raise ValueError(f"Can not factor {n}")
+
+    result, n = trial_division(n)
+    composites = [(n, 1)] if n > 1 else []
+
+    while composites:
+        m, multiplicity = composites.pop()
+        if is_prime(m):
+            result[m] = result.get(m, 0) + multiplicity
+            continue
+
+        root, k = _perfect_power(m)
+        if k > 1:
+            composites.append((root, multiplicity * k))
+            continue
+
+        d = _find_factor(m)
+        composites.append((d, multiplicity))
+        composites.append((m // d, multiplicity))
+
+    return dict(sorted(result.items()))
+
+
+def check_factorization(n: int, factors: dict[int, int]) -> dict[int, int]:
+    """Verifies that factors is factorization of n as a map {prime: exponent}
+    and returns it sorted. Raises ValueError otherwise."""
+    product = 1
+    for p, e in factors.items():
+        if e < 1 or not is_prime(p):
+            raise ValueError(f"{p}^{e} is not prime power")
+        product *= p**e
+    if product != n:
+        raise ValueError(f"Factors do not multiply to {n}")
+    return dict(sorted(factors.items()))
+
+
+def divisors(n: int | dict[int, int]) -> list[int]:
+    """Returns sorted list of all divisors of n (or of factorization {prime: exponent})"""
+    factorization = n if isinstance(n, dict) else factorize(n)
+    result = [1]
+    for p, e in factorization.items():
+        result = [d * p**k for d in result for k in range(e + 1)]
+    return sorted(result)
+
+
+def factors(n):
+    """Returns factors of an integer provided as an argument"""
+    return [p for p, e in factorize(n).items() for _ in range(e)]
+
+
+def all_factors(N):
+    """Returns set of all factors of N."""
+    return set(divisors(N))
+
+
+def factor(n):
+    """Returns the smallest prime factor of n > 1"""
+    if n <= 1:
+        raise ValueError(f"Can not factor {n}")
+    return next(iter(factorize(n)))
@@ -0,0 +1,178 @@
+"""(module) containing vectorized arrays of finite field elements backed by NumPy"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .integer import ZP
+from .utils import gf_operation
+
+# Largest modulus for which product of two reduced values fits in int64
+MAX_ARRAY_PRIME = 2**31
+
+
+def array_supported(p: int) -> bool:
+    """Check if elements of prime field of order p can be stored in FieldArray"""
+    return np is not None and p < MAX_ARRAY_PRIME
+
+
+class FieldArray:
+    """Array of finite field elements supporting vectorized arithmetic.
+    Elements are kept reduced in int64 NumPy array, so p must be below 2^31."""
+
+    def __init__(self, gf, values):
+        if np is None:
+            raise ImportError("FieldArray requires numpy to be installed")
+        if gf.p >= MAX_ARRAY_PRIME:
+            raise ValueError(f"FieldArray supports only primes below {MAX_ARRAY_PRIME}")
+
+        self.gf = gf
+        self.p: int = gf.p
+
+        if isinstance(values, np.ndarray):
+            data = np.mod(values.astype(np.int64), self.p)
+        elif isinstance(values, range):
+            data = np.mod(np.arange(values.start, values.stop, values.step), self.p)
+        else:
+            data = [x.value if isinstance(x, ZP) else x % self.p for x in values]
+        self.values = np.asarray(data, dtype=np.int64)
+
+    @classmethod
+    def random(cls, gf, size: int):
+        """Array of uniformly distributed random field elements"""
+        if np is None:
+            raise ImportError("FieldArray requires numpy to be installed")
+        return cls(gf, np.random.default_rng().integers(0, gf.p, size, dtype=np.int64))
+
+    def inverse(self):
+        """Elementwise multiplicative inverse"""
+        if not np.all(self.values):
+            raise ZeroDivisionError("Element 0 is not inversable")
+        return self._from_values(self._pow(self.values, self.p - 2))
+
+    def legendre(self):
+        """Legendre symbols of elements as array of -1, 0 and 1"""
+        symbols = self._pow(self.values, (self.p - 1) // 2)
+        # For p = 2 exponent is zero and 1 = p - 1, so zero is checked directly
+        return np.where(self.values == 0, 0, np.where(symbols == 1, 1, -1))
+
+    def is_quadratic_residue(self):
+        """Boolean array marking elements which have square root"""
+        return self.legendre() >= 0
+
+    def sum(self) -> ZP:
+        """Sum of all elements"""
+        total = 0
+        # Chunks keep partial sums of values below 2^31 within int64
+        for start in range(0, len(self.values), 2**31):
+            total += int(np.sum(self.values[start : start + 2**31]))
+        return self.gf.element(total)
+
+    def prod(self) -> ZP:
+        """Product of all elements"""
+        values = self.values
+        if len(values) == 0:
+            return self.gf.one()
+        while len(values) > 1:
+            if len(values) % 2 == 1:
+                values = np.append(values, 1)
+            half = len(values) // 2
+            values = values[:half] * values[half:] % self.p
+        return self.gf.element(int(values[0]))
+
+    def to_list(self) -> list[ZP]:
+        """Convert array into list of field elements"""
+        return [self.gf.element(int(v)) for v in self.values]
+
+    def _from_values(self, values):
+        result = FieldArray.__new__(FieldArray)
+        result.gf = self.gf
+        result.p = self.p
+        result.values = values
+        return result
+
+    def _operand(self, other):
+        if isinstance(other, FieldArray):
+            if len(other) != len(self):
+                raise ValueError("FieldArray operands must have the same length")
+            return other.values
+        if isinstance(other, ZP):
+            if other.gf != self.gf:
+                raise ValueError(f"{self} field does not match {other} field")
+            return other.value
+        if isinstance(other, int):
+            return other % self.p
+        raise TypeError(f"Invalid operand {other} for FieldArray operation")
+
+    def _pow(self, values, exp: int):
+        result = np.ones_like(values)
+        base = values.copy()
+        while exp > 0:
+            if exp % 2 == 1:
+                result = result * base % self.p
+            base = base * base % self.p
+            exp //= 2
+        return result
+
+    @gf_operation
+    def __add__(self, other):
+        return self._from_values((self.values + self._operand(other)) % self.p)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    @gf_operation
+    def __sub__(self, other):
+        return self._from_values((self.values - self._operand(other)) % self.p)
+
+    def __rsub__(self, other):
+        return self._from_values((self._operand(other) - self.values) % self.p)
+
+    @gf_operation
+    def __mul__(self, other):
+        return self._from_values(self.values * self._operand(other) % self.p)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    @gf_operation
+    def __truediv__(self, other):
+        if isinstance(other, FieldArray):
+            return self * other.inverse()
+        return self * self.gf.element(self._operand(other)).inverse()
+
+    def __pow__(self, other):
+        exp = other.value if isinstance(other, ZP) else other
+        if not isinstance(exp, int):
+            raise ValueError("Exponent must be an integer")
+        if exp < 0:
+            return self.inverse() ** (-exp)
+        return self._from_values(self._pow(self.values, exp))
+
+    def __neg__(self):
+        return self._from_values((-self.values) % self.p)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_values(self.values[index])
+        return self.gf.element(int(self.values[index]))
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, FieldArray):
+            return self.gf == other.gf and np.array_equal(self.values, other.values)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return False
+
+    def __str__(self):
+        return f"[{', '.join(str(v) for v in self.values)}]"
+
+    def __repr__(self):
+        return str(self)
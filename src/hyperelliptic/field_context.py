@@ -0,0 +1,250 @@
+"""(module) containing arithmetic context operating on plain integers modulo prime"""
+
+from .multiplication import KARATSUBA_THRESHOLD, TOOM3_THRESHOLD, multiply
+from .half_gcd import hgcd_xgcd
+from .ntt import ntt_multiply, ntt_supported
+
+
+def strip_coeff(coeff: list[int]) -> list[int]:
+    """Remove leading zero coefficients of integer polynomial"""
+    for i, c in enumerate(coeff):
+        if c != 0:
+            return coeff[i:] if i else coeff
+    return [0]
+
+
+class FieldContext:
+    """Low level arithmetic of prime field on unboxed integers.
+    Values are expected to be already reduced mod p. Polynomials are lists
+    of integers ordered from the most significant coefficient,
+    the same way Polynomial.coeff is ordered."""
+
+    # Degree thresholds of fast multiplication, see multiplication module
+    KARATSUBA_THRESHOLD = KARATSUBA_THRESHOLD
+    TOOM3_THRESHOLD = TOOM3_THRESHOLD
+
+    # Operands at least this long are multiplied with Kronecker substitution
+    KRONECKER_THRESHOLD = 8
+
+    # Operands at least this long are multiplied with number theoretic transform
+    NTT_THRESHOLD = 2048
+
+    # Polynomials longer than this use half-GCD, see half_gcd module
+    HGCD_THRESHOLD = 128
+
+    def __init__(self, p: int) -> None:
+        self.p: int = p
+
+    def reduce(self, a: int) -> int:
+        """Canonical representative of a mod p"""
+        return a % self.p
+
+    def add(self, a: int, b: int) -> int:
+        """Sum of two elements"""
+        s = a + b
+        return s - self.p if s >= self.p else s
+
+    def sub(self, a: int, b: int) -> int:
+        """Difference of two elements"""
+        s = a - b
+        return s + self.p if s < 0 else s
+
+    def neg(self, a: int) -> int:
+        """Additive inverse of an element"""
+        return self.p - a if a else 0
+
+    def mul(self, a: int, b: int) -> int:
+        """Product of two elements"""
+        return a * b % self.p
+
+    def sqr(self, a: int) -> int:
+        """Square of an element"""
+        return a * a % self.p
+
+    def inv(self, a: int) -> int:
+        """Multiplicative inverse of an element"""
+        if a % self.p == 0:
+            raise ZeroDivisionError("Element 0 is not inversable")
+        return pow(a, -1, self.p)
+
+    def batch_inv(self, values: list[int]) -> list[int]:
+        """Inverses of all values using single inversion (Montgomery's trick)"""
+        p = self.p
+        prefix = []
+        acc = 1
+        for v in values:
+            if v % p == 0:
+                raise ZeroDivisionError("Element 0 is not inversable")
+            prefix.append(acc)
+            acc = acc * v % p
+
+        acc_inv = self.inv(acc)
+        result = [0] * len(values)
+        for i in range(len(values) - 1, -1, -1):
+            result[i] = acc_inv * prefix[i] % p
+            acc_inv = acc_inv * values[i] % p
+        return result
+
+    def div(self, a: int, b: int) -> int:
+        """Quotient of two elements"""
+        return a * self.inv(b) % self.p
+
+    def pow(self, a: int, exp: int) -> int:
+        """Power of an element"""
+        return pow(a, exp, self.p)
+
+    def poly_add(self, a: list[int], b: list[int]) -> list[int]:
+        """Sum of two polynomials"""
+        p = self.p
+        if len(a) < len(b):
+            a, b = b, a
+        shift = len(a) - len(b)
+        result = a[:shift] + [(x + y) % p for x, y in zip(a[shift:], b)]
+        return strip_coeff(result)
+
+    def poly_sub(self, a: list[int], b: list[int]) -> list[int]:
+        """Difference of two polynomials"""
+        return self.poly_add(a, self.poly_neg(b))
+
+    def poly_neg(self, a: list[int]) -> list[int]:
+        """Additive inverse of polynomial"""
+        p = self.p
+        return [(p - x) % p for x in a]
+
+    def poly_scale(self, a: list[int], c: int) -> list[int]:
+        """Product of polynomial and scalar"""
+        p = self.p
+        return strip_coeff([x * c % p for x in a])
+
+    def poly_mul(self, a: list[int], b: list[int]) -> list[int]:
+        """Product of two polynomials"""
+        if self._uses_ntt(a, b):
+            return strip_coeff(ntt_multiply(a, b, self.p))
+        if min(len(a), len(b)) >= self.KRONECKER_THRESHOLD:
+            width = self._slot_bytes(min(len(a), len(b)))
+            product = self._pack(a, width) * self._pack(b, width)
+            return self._unpack(product, width, len(a) + len(b) - 1)
+
+        # Product is computed over integers where Toom-3 divisions are exact
+        result = multiply(
+            a,
+            b,
+            0,
+            lambda c, k: c // k,
+            self.KARATSUBA_THRESHOLD,
+            self.TOOM3_THRESHOLD,
+        )
+        # Reduction is delayed until all partial products are accumulated
+        p = self.p
+        return strip_coeff([c % p for c in result])
+
+    def poly_sqr(self, a: list[int]) -> list[int]:
+        """Square of polynomial"""
+        if self._uses_ntt(a, a):
+            return strip_coeff(ntt_multiply(a, a, self.p))
+        if len(a) < self.KRONECKER_THRESHOLD:
+            return self.poly_mul(a, a)
+        width = self._slot_bytes(len(a))
+        packed = self._pack(a, width)
+        return self._unpack(packed * packed, width, 2 * len(a) - 1)
+
+    def _uses_ntt(self, a: list[int], b: list[int]) -> bool:
+        if min(len(a), len(b)) < self.NTT_THRESHOLD:
+            return False
+        return ntt_supported(self.p, len(a) + len(b) - 1)
+
+    def _slot_bytes(self, terms: int) -> int:
+        # Coefficients of product are sums of at most terms products below p^2
+        bound = terms * (self.p - 1) ** 2
+        return max(1, (bound.bit_length() + 7) // 8)
+
+    def _pack(self, a: list[int], width: int) -> int:
+        # Kronecker substitution x = 2^(8 * width), coefficients are byte aligned
+        return int.from_bytes(b"".join(c.to_bytes(width, "big") for c in a), "big")
+
+    def _unpack(self, packed: int, width: int, size: int) -> list[int]:
+        data = packed.to_bytes(width * size, "big")
+        p = self.p
+        return strip_coeff(
+            [
+                int.from_bytes(data[i : i + width], "big") % p
+                for i in range(0, width * size, width)
+            ]
+        )
+
+    def poly_divmod(self, a: list[int], b: list[int]) -> tuple[list[int], list[int]]:
+        """Quotient and remainder of polynomial division"""
+        quotient, remainder = self._long_division(a, b, with_quotient=True)
+        return strip_coeff(quotient), remainder
+
+    def poly_mod(self, a: list[int], b: list[int]) -> list[int]:
+        """Remainder of polynomial division"""
+        return self._long_division(a, b, with_quotient=False)[1]
+
+    def poly_eval(self, a: list[int], x: int) -> int:
+        """Value of polynomial at point x (Horner's rule)"""
+        p = self.p
+        result = 0
+        for c in a:
+            result = (result * x + c) % p
+        return result
+
+    def poly_gcd(self, a: list[int], b: list[int]) -> list[int]:
+        """Monic greatest common divisor of two polynomials"""
+        if max(len(a), len(b)) > self.HGCD_THRESHOLD:
+            return self._to_monic(hgcd_xgcd(self, a, b)[0])
+        while b != [0]:
+            a, b = b, self.poly_mod(a, b)
+        return self._to_monic(a)
+
+    def poly_xgcd(self, a: list[int], b: list[int]):
+        """Returns (g, s, t) such that g = s * a + t * b is monic gcd of a and b"""
+        if max(len(a), len(b)) > self.HGCD_THRESHOLD:
+            g, s, t = hgcd_xgcd(self, a, b)
+        else:
+            g, s, t = a, [1], [0]
+            r, s1, t1 = b, [0], [1]
+            while r != [0]:
+                q, rem = self.poly_divmod(g, r)
+                g, r = r, rem
+                s, s1 = s1, self.poly_sub(s, self.poly_mul(q, s1))
+                t, t1 = t1, self.poly_sub(t, self.poly_mul(q, t1))
+
+        if g == [0]:
+            return g, s, t
+        lead_inv = self.inv(g[0])
+        return tuple(self.poly_scale(x, lead_inv) for x in (g, s, t))
+
+    def _to_monic(self, a: list[int]) -> list[int]:
+        if a[0] in (0, 1):
+            return a
+        return self.poly_scale(a, self.inv(a[0]))
+
+    def _long_division(self, a: list[int], b: list[int], with_quotient: bool):
+        if b == [0]:
+            raise ZeroDivisionError("Polynomial division by zero")
+        if len(a) < len(b):
+            return [0], a
+
+        p = self.p
+        n = len(b)
+        size = len(a) - n + 1
+        lead_inv = 1 if b[0] == 1 else self.inv(b[0])
+        # Negated divisor turns each step into multiply-accumulate
+        divisor = [p - c for c in b[1:]]
+        remainder = list(a)
+        quotient = [0] * size if with_quotient else None
+
+        for i in range(size):
+            # Reduction of remainder is delayed until its coefficient is needed
+            c = remainder[i] % p
+            if c == 0:
+                continue
+            if lead_inv != 1:
+                c = c * lead_inv % p
+            if quotient is not None:
+                quotient[i] = c
+            for j, d in enumerate(divisor, i + 1):
+                remainder[j] += c * d
+
+        return quotient, strip_coeff([c % p for c in remainder[size:]])
@@ -0,0 +1,322 @@
+"""(module) containing dense matrices over prime field with Gaussian elimination"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .field_array import array_supported
+from .integer import ZP
+from .utils import gf_operation
+
+# Largest absolute value of int64 entries before reduction is forced
+MAX_INT64 = 2**63 - 1
+
+# Integers up to this bound are represented exactly in float64
+MAX_FLOAT_EXACT = 2**53
+
+
+class FieldMatrix:
+    """Dense matrix over prime field. For word-sized p (p < 2^31) entries are
+    kept in int64 NumPy array and reductions modulo p are delayed as long as
+    accumulated products fit in int64, otherwise rows are lists of ints."""
+
+    def __init__(self, gf, rows) -> None:
+        self.gf = gf
+        self.p: int = gf.p
+
+        values = [[self._parse(x) for x in row] for row in rows]
+        if values and len(set(len(row) for row in values)) > 1:
+            raise ValueError("FieldMatrix rows must have the same length")
+        self.shape: tuple[int, int] = (len(values), len(values[0]) if values else 0)
+
+        if array_supported(self.p):
+            self.values = np.array(values, dtype=np.int64).reshape(self.shape)
+        else:
+            self.values = values
+
+    @classmethod
+    def identity(cls, gf, size: int) -> "FieldMatrix":
+        """Identity matrix of given size"""
+        return cls(gf, [[int(i == j) for j in range(size)] for i in range(size)])
+
+    def _parse(self, value) -> int:
+        if isinstance(value, ZP):
+            return value.value
+        if isinstance(value, int):
+            return value % self.p
+        return int(value) % self.p
+
+    def _from_values(self, values, shape=None):
+        result = FieldMatrix.__new__(FieldMatrix)
+        result.gf = self.gf
+        result.p = self.p
+        result.values = values
+        if shape is None:
+            shape = values.shape if self._is_array() else (len(values), len(values[0]))
+        result.shape = tuple(shape)
+        return result
+
+    def _is_array(self) -> bool:
+        return np is not None and isinstance(self.values, np.ndarray)
+
+    def _int_rows(self) -> list[list[int]]:
+        """Rows of matrix as lists of reduced integers"""
+        if self._is_array():
+            return self.values.tolist()
+        return [list(row) for row in self.values]
+
+    def to_list(self) -> list[list[ZP]]:
+        """Convert matrix into list of rows of field elements"""
+        return [[self.gf.element(x) for x in row] for row in self._int_rows()]
+
+    def transpose(self) -> "FieldMatrix":
+        """Transposed matrix"""
+        rows, cols = self.shape
+        if self._is_array():
+            return self._from_values(self.values.T.copy())
+        return self._from_values([list(col) for col in zip(*self.values)], (cols, rows))
+
+    def row_reduce(self) -> tuple["FieldMatrix", list[int]]:
+        """Reduced row echelon form without zero rows and list of pivot columns"""
+        reduced, pivots, _ = self._eliminate()
+        return self._from_values(reduced, (len(pivots), self.shape[1])), pivots
+
+    def rank(self) -> int:
+        """Rank of matrix"""
+        return len(self._eliminate()[1])
+
+    def nullspace(self) -> "FieldMatrix":
+        """Matrix whose rows form basis of vectors v such that self * v = 0"""
+        cols = self.shape[1]
+        reduced, pivots, _ = self._eliminate()
+        if self._is_array():
+            reduced = reduced.tolist()
+
+        basis = []
+        for free in sorted(set(range(cols)) - set(pivots)):
+            v = [0] * cols
+            v[free] = 1
+            for row, pivot in zip(reduced, pivots):
+                v[pivot] = -row[free] % self.p
+            basis.append(v)
+        if not basis:
+            return self._from_values(self._empty(cols), (0, cols))
+        return FieldMatrix(self.gf, basis)
+
+    def solve(self, b) -> list[ZP]:
+        """Returns vector x such that self * x = b, free variables are set to zero.
+        Raises ValueError if system has no solution."""
+        rows, cols = self.shape
+        b = [self._parse(x) for x in b]
+        if len(b) != rows:
+            raise ValueError(f"Right hand side must have {rows} entries")
+
+        augmented = [row + [y] for row, y in zip(self._int_rows(), b)]
+        reduced, pivots, _ = FieldMatrix(self.gf, augmented)._eliminate()
+        if pivots and pivots[-1] == cols:
+            raise ValueError("System of linear equations has no solution")
+
+        solution = [0] * cols
+        for row, pivot in zip(reduced, pivots):
+            solution[pivot] = int(row[cols])
+        return [self.gf.element(x) for x in solution]
+
+    def determinant(self) -> ZP:
+        """Determinant of square matrix"""
+        rows, cols = self.shape
+        if rows != cols:
+            raise ValueError(f"Determinant of {rows}x{cols} matrix is not defined")
+        _, pivots, det = self._eliminate()
+        return self.gf.element(det if len(pivots) == rows else 0)
+
+    def _empty(self, cols: int):
+        if self._is_array():
+            return np.zeros((0, cols), dtype=np.int64)
+        return []
+
+    def _eliminate(self):
+        """Gauss-Jordan elimination. Returns nonzero rows of reduced row echelon
+        form, pivot columns and product of pivots with sign of row swaps."""
+        if self._is_array():
+            return self._eliminate_array()
+
+        p = self.p
+        rows = [list(row) for row in self.values]
+        pivots, det = [], 1
+        for col in range(self.shape[1]):
+            r = len(pivots)
+            if r == len(rows):
+                break
+            k = next((k for k in range(r, len(rows)) if rows[k][col]), None)
+            if k is None:
+                continue
+            if k != r:
+                rows[r], rows[k] = rows[k], rows[r]
+                det = -det
+
+            pivot = rows[r][col]
+            det = det * pivot % p
+            inv = pow(pivot, -1, p)
+            pivot_row = rows[r][:col] + [x * inv % p for x in rows[r][col:]]
+            rows[r] = pivot_row
+            for i, row in enumerate(rows):
+                c = row[col]
+                if i != r and c:
+                    tail = [(x - c * y) % p for x, y in zip(row[col:], pivot_row[col:])]
+                    rows[i] = row[:col] + tail
+            pivots.append(col)
+        return rows[: len(pivots)], pivots, det % p
+
+    def _eliminate_array(self):
+        # Entries are reduced lazily: every update adds product below (p - 1)^2,
+        # the active block is reduced only before int64 could overflow.
+        p = self.p
+        a = self.values.copy()
+        n, cols = a.shape
+        updates = (MAX_INT64 - p) // (p - 1) ** 2
+        pending = 0
+
+        pivots, det = [], 1
+        for col in range(cols):
+            r = len(pivots)
+            if r == n:
+                break
+            a[:, col] %= p
+            nonzero = np.flatnonzero(a[r:, col])
+            if len(nonzero) == 0:
+                continue
+            k = r + int(nonzero[0])
+            if k != r:
+                a[[r, k], col:] = a[[k, r], col:]
+                det = -det
+
+            pivot = int(a[r, col])
+            det = det * pivot % p
+            a[r, col:] = a[r, col:] % p * pow(pivot, -1, p) % p
+            factors = a[:, col].copy()
+            factors[r] = 0
+
+            if pending == updates:
+                a[:, col + 1 :] %= p
+                pending = 0
+            a[:, col:] -= np.outer(factors, a[r, col:])
+            pending += 1
+            pivots.append(col)
+
+        a = a[: len(pivots)] % p
+        return a, pivots, det % p
+
+    def _operand(self, other):
+        if isinstance(other, FieldMatrix):
+            if other.shape != self.shape:
+                raise ValueError("FieldMatrix operands must have the same shape")
+            return other.values
+        return self._parse(other)
+
+    @gf_operation
+    def __add__(self, other):
+        values = self._operand(other)
+        if self._is_array():
+            return self._from_values((self.values + values) % self.p)
+        if isinstance(other, FieldMatrix):
+            return self._from_values(
+                [
+                    [(x + y) % self.p for x, y in zip(a, b)]
+                    for a, b in zip(self.values, values)
+                ],
+                self.shape,
+            )
+        return self._from_values(
+            [[(x + values) % self.p for x in row] for row in self.values], self.shape
+        )
+
+    @gf_operation
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __neg__(self):
+        if self._is_array():
+            return self._from_values((-self.values) % self.p)
+        return self._from_values(
+            [[-x % self.p for x in row] for row in self.values], self.shape
+        )
+
+    @gf_operation
+    def __mul__(self, other):
+        if isinstance(other, FieldMatrix):
+            return self @ other
+        c = self._parse(other)
+        if self._is_array():
+            return self._from_values(self.values * c % self.p)
+        return self._from_values(
+            [[x * c % self.p for x in row] for row in self.values], self.shape
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    @gf_operation
+    def __matmul__(self, other):
+        rows, inner = self.shape
+        if inner != other.shape[0]:
+            raise ValueError(
+                f"Can not multiply {self.shape} and {other.shape} matrices"
+            )
+        shape = (rows, other.shape[1])
+        p = self.p
+
+        if self._is_array():
+            return self._from_values(self._product_array(other.values, shape))
+
+        columns = list(zip(*other.values))
+        return self._from_values(
+            [
+                [sum(x * y for x, y in zip(row, col)) % p for col in columns]
+                for row in self.values
+            ],
+            shape,
+        )
+
+    def _product_array(self, other, shape):
+        # Blocks of inner dimension are summed before single reduction. While sums
+        # stay below 2^53 products are exact in float64, so NumPy can use BLAS.
+        p = self.p
+        inner = self.shape[1]
+        a, b = self.values, other
+        block = MAX_FLOAT_EXACT // (p - 1) ** 2
+        if block > 0:
+            a, b = a.astype(np.float64), b.astype(np.float64)
+        else:
+            block = (MAX_INT64 - p) // (p - 1) ** 2
+
+        result = np.zeros(shape, dtype=np.int64)
+        for start in range(0, inner, block):
+            end = start + block
+            product = a[:, start:end] @ b[start:end]
+            result = (result + np.fmod(product, p).astype(np.int64)) % p
+        return result
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = index
+            return self.gf.element(int(self.values[i][j]))
+        return [self.gf.element(int(x)) for x in self.values[index]]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __eq__(self, other):
+        if isinstance(other, FieldMatrix):
+            return self.gf == other.gf and self._int_rows() == other._int_rows()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return False
+
+    def __str__(self):
+        return "\n".join(
+            f"[{', '.join(str(x) for x in row)}]" for row in self._int_rows()
+        )
+
+    def __repr__(self):
+        return str(self)
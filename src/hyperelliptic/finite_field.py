@@ -2,21 +2,50 @@
 
 from random import randint
 
-from .utils import is_prime
+from .utils import is_prime, jacobi
+from .factorization import check_factorization, factorize
 from .galois_field import GaloisField
 from .ring_polynomial import RingPolynomial
 from .hyperelliptic import HC
 from .integer import ZP
+from .field_context import FieldContext
+from .field_array import FieldArray, array_supported
+from .field_matrix import FieldMatrix
+from .sqrt_context import SqrtContext
+from .registry import Registry
 
 
 class FiniteField:
     """Provides set of tools which allow operations over Finite Field"""
 
+    _registry = Registry()
+
     def __init__(self, p: int) -> None:
         if not is_prime(p):
             raise ValueError(f"{p} is not prime")
 
         self.p: int = p
+        # Degree over prime subfield and order, the same way as in GaloisField
+        self.m: int = 1
+        self.q: int = p
+        self.ctx: FieldContext = FieldContext(p)
+        self.sqrt_ctx: SqrtContext = SqrtContext(p, self.ctx, 0, 1, self._non_residue)
+        self._order_factors: dict[int, int] | None = None
+
+    @classmethod
+    def get(cls, p: int) -> "FiniteField":
+        """Return interned Finite Field. Primality of p is verified only once per process"""
+        return cls._registry.get(p, lambda: cls(p))
+
+    def order_factors(self, known: dict[int, int] | None = None) -> dict[int, int]:
+        """Returns factorization of multiplicative group order p - 1 as {prime: exponent}.
+        It is computed once per field, which may take minutes for 256-bit orders
+        with large cofactors; known factorization can be supplied and is verified."""
+        if known is not None:
+            self._order_factors = check_factorization(self.p - 1, known)
+        elif self._order_factors is None:
+            self._order_factors = factorize(self.p - 1)
+        return self._order_factors
 
     def zero(self) -> ZP:
         """Return addition neutral element of Finite Field"""
@@ -28,25 +57,55 @@ class FiniteField:
 
     def element(self, value: int | ZP) -> ZP:
         """Return element of Finite Field (integer) from scalar value"""
+        if isinstance(value, ZP):
+            value = value.value
         return ZP(self, value)
 
+    def batch_inverse(self, elements: list[ZP] | list[int]) -> list[ZP]:
+        """Return inverses of all elements computed with a single field inversion"""
+        values = [self.element(x).value for x in elements]
+        return [self.element(v) for v in self.ctx.batch_inv(values)]
+
+    def jacobi_many(self, values) -> list[int]:
+        """Returns Jacobi (Legendre) symbols of many elements at once"""
+        if array_supported(self.p) and self.p > 2:
+            return [int(s) for s in self.array(values).legendre()]
+        values = [x.value if isinstance(x, ZP) else x for x in values]
+        if self.p == 2:
+            return [x % 2 for x in values]
+        return [jacobi(x, self.p) for x in values]
+
     def get_elements(self) -> range:
         """Returns range of all elements in Finite Field"""
         return range(0, self.p)
 
+    def array(self, values) -> FieldArray:
+        """Returns vectorized array of Finite Field elements (requires numpy and p < 2^31)"""
+        return FieldArray(self, values)
+
+    def matrix(self, rows) -> FieldMatrix:
+        """Returns dense matrix over Finite Field given by list of rows"""
+        return FieldMatrix(self, rows)
+
     def poly(self, coeff: list[ZP] | list[int], symbol: str = "x") -> RingPolynomial:
         """Returns polynomial over Finite Field"""
         parsed_coeff = self._parse_coeff(coeff)
         return RingPolynomial(self, parsed_coeff, symbol)
 
-    def extension(self, polynomial: RingPolynomial) -> GaloisField:
+    def extension(
+        self, polynomial: RingPolynomial, tables: bool = False
+    ) -> GaloisField:
         """Return linear space (Galois Field) over Finite Field using irreducible polynomial provided in argument"""
-        return GaloisField(self, polynomial)
+        return GaloisField(self, polynomial, tables)
 
     def rand_element(self):
         """Returns random element from Finite Field"""
         return self.element(randint(0, self.p - 1))
 
+    def rand_array(self, size: int) -> FieldArray:
+        """Returns array of random elements from Finite Field"""
+        return FieldArray.random(self, size)
+
     def rand_poly(self, deg: int):
         """Returns random vector (polynomial) defined over Finite Field"""
         return self.poly([self.rand_element() for _ in range(deg + 1)])
@@ -65,6 +124,12 @@ class FiniteField:
         """Returns hyperelliptic curve defined over Finite Field"""
         return HC(self, h, f)
 
+    def _non_residue(self) -> int:
+        z = 2
+        while pow(z, (self.p - 1) // 2, self.p) != self.p - 1:
+            z += 1
+        return z
+
     def _is_field_element(self, value) -> bool:
         return isinstance(value, ZP) and value.gf == self
 
@@ -79,6 +144,8 @@ class FiniteField:
         raise ValueError(f"Invalid value for {self} element")
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.p == other.p
 
     def __str__(self):
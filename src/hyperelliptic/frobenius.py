@@ -0,0 +1,121 @@
+"""(module) containing Frobenius map modulo fixed polynomial"""
+
+from math import isqrt
+
+from .field_context import strip_coeff
+from .poly_modulus import PolyModulus
+
+
+class FrobeniusContext:
+    """Frobenius map g -> g^q modulo polynomial f over field of order q.
+    x^q mod f is computed once. Since g^q = g(x^q) for g with coefficients
+    in the field, the map is applied as modular composition with x^q
+    (Brent-Kung baby-step giant-step), so iterated powers x^(q^i) cost
+    about sqrt(deg f) modular multiplications each instead of log(q)."""
+
+    def __init__(self, modulus, xq=None) -> None:
+        self.modulus = modulus
+        self.reducer = PolyModulus(modulus)
+        self.q: int = modulus.gf.q
+        self.ctx = modulus._int_ctx()  # pylint: disable=protected-access
+
+        one, zero = modulus.coeff_one(), modulus.coeff_zero()
+        self.x = self.reducer.reduce(modulus._from_coeff([one, zero]))
+        if xq is None:
+            xq = pow(self.x, self.q, self.reducer)
+        self.xq = self.reducer.reduce(xq)
+        # Composition tables of x^(q^(2^j)) for j = 0, 1, ...
+        self._doublings = []
+
+    def frobenius(self, g, times: int = 1):
+        """Returns g^(q^times) mod f"""
+        for _ in range(times):
+            g = self.compose(g)
+        return g
+
+    def x_powers(self, count: int):
+        """Yields x^(q^i) mod f for i = 1, ..., count"""
+        h = self.x
+        for _ in range(count):
+            h = self.compose(h)
+            yield h
+
+    def x_power(self, k: int):
+        """Returns x^(q^k) mod f. Since x^(q^(a+b)) = x^(q^a) composed with
+        x^(q^b), binary powering needs O(log k) modular compositions.
+        Powers x^(q^(2^j)) with their composition tables are cached."""
+        result, j = self.x, 0
+        while k >> j:
+            if (k >> j) & 1:
+                result = self._compose(result, self._doubling(j))
+            j += 1
+        return result
+
+    def compose(self, g):
+        """Returns g(x^q) mod f"""
+        return self._compose(g, self._doubling(0))
+
+    def _doubling(self, j: int):
+        # Table of x^(q^(2^j)), the next power is the previous one composed with itself
+        if not self._doublings:
+            self._doublings.append((self.xq, self._powers(self.xq)))
+        while len(self._doublings) <= j:
+            power, table = self._doublings[-1]
+            power = self._compose(power, table)
+            self._doublings.append((power, self._powers(power)))
+        return self._doublings[j][1]
+
+    def _compose(self, g, table):
+        # g(h) mod f for table of baby steps and giant step of h
+        baby, giant = table
+        if self.ctx is not None:
+            # pylint: disable=protected-access
+            return g._from_ints(self._compose_ints(g._to_ints(), baby, giant))
+
+        k = len(baby)
+        coeff = g.coeff[::-1]
+        result = g.zero()
+        for j in reversed(range(0, len(coeff), k)):
+            block = g.zero()
+            for c, power in zip(coeff[j : j + k], baby):
+                if c != 0:
+                    block = block + g._from_coeff([c]) * power
+            result = self.reducer.reduce(result * giant) + block
+        return result
+
+    def _powers(self, h):
+        # Powers h^i for i < k and giant step h^k where k ~ sqrt(deg f)
+        k = isqrt(self.modulus.deg) + 1
+        powers = [self.x.one()]
+        for _ in range(k):
+            powers.append(self.reducer.reduce(powers[-1] * h))
+        giant = powers.pop()
+        if self.ctx is not None:
+            # pylint: disable=protected-access
+            return [power._to_ints() for power in powers], giant._to_ints()
+        return powers, giant
+
+    def _compose_ints(self, coeff: list[int], baby, giant) -> list[int]:
+        ctx = self.ctx
+        p = ctx.p
+        n = self.modulus.deg
+        k = len(baby)
+        coeff = coeff[::-1]
+
+        result = [0]
+        for j in reversed(range(0, len(coeff), k)):
+            # Linear combination of baby steps with delayed reduction
+            block = [0] * n
+            for c, power in zip(coeff[j : j + k], baby):
+                if c == 0:
+                    continue
+                shift = n - len(power)
+                for i, b in enumerate(power, shift):
+                    block[i] += c * b
+            if result != [0]:
+                result = self.reducer.reduce_ints(ctx.poly_mul(result, giant))
+                shift = n - len(result)
+                for i, r in enumerate(result, shift):
+                    block[i] += r
+            result = strip_coeff([c % p for c in block])
+        return result
@@ -6,25 +6,64 @@ from .ring_polynomial import RingPolynomial
 from .gf_polynomial import GF_Polynomial
 from .hyperelliptic import HC
 from .integer import ZP
+from .log_tables import LogTables
+from .poly_modulus import PolyModulus
+from .sqrt_context import SqrtContext, ElementOps
+from .registry import Registry
+from .factorization import check_factorization, factorize
 
 if TYPE_CHECKING:
     from .finite_field import FiniteField
 
 
 class GaloisField:
-    """Provides set of tools which allow operations over Galois Field"""
+    """Provides set of tools which allow operations over Galois Field.
+    With tables=True multiplication, inversion, powering and square roots
+    of elements are computed with log/antilog tables (small fields only)."""
 
-    def __init__(self, base: "FiniteField", polynomial: RingPolynomial):
+    _registry = Registry()
+
+    def __init__(
+        self, base: "FiniteField", polynomial: RingPolynomial, tables: bool = False
+    ):
         if base != polynomial.gf:
             raise ValueError(f"{polynomial} must be defined over base field {base}")
         if not polynomial.is_irreducible():
             raise ValueError(f"{polynomial} is not irreducible")
 
         self._poly: RingPolynomial = polynomial
+        self.modulus: PolyModulus = PolyModulus(polynomial)
         self.base: FiniteField = base
         self.p: int = base.p
         self.m: int = polynomial.deg
         self.q: int = self.p**self.m
+        self.tables: LogTables | None = None
+        self._order_factors: dict[int, int] | None = None
+        self.sqrt_ctx: SqrtContext = SqrtContext(
+            self.q, ElementOps(), self.zero(), self.one(), self._non_residue
+        )
+
+        if tables:
+            self.tables = LogTables(self)
+
+    @classmethod
+    def get(
+        cls, base: "FiniteField", polynomial: RingPolynomial, tables: bool = False
+    ) -> "GaloisField":
+        """Return interned Galois Field. Irreducibility of polynomial is verified
+        only once per process"""
+        key = (base.p, tuple(c.value for c in polynomial.coeff), tables)
+        return cls._registry.get(key, lambda: cls(base, polynomial, tables))
+
+    def order_factors(self, known: dict[int, int] | None = None) -> dict[int, int]:
+        """Returns factorization of multiplicative group order q - 1 as {prime: exponent}.
+        It is computed once per field, which may take minutes for 256-bit orders
+        with large cofactors; known factorization can be supplied and is verified."""
+        if known is not None:
+            self._order_factors = check_factorization(self.q - 1, known)
+        elif self._order_factors is None:
+            self._order_factors = factorize(self.q - 1)
+        return self._order_factors
 
     def zero(self) -> GF_Polynomial:
         """Return addition neutral element of Galois Field"""
@@ -43,6 +82,24 @@ class GaloisField:
         parsed_coeff = self.base._parse_coeff(value)  # pylint: disable=protected-access
         return GF_Polynomial(self, parsed_coeff)
 
+    def batch_inverse(self, elements: list[GF_Polynomial]) -> list[GF_Polynomial]:
+        """Return inverses of all elements computed with a single field inversion
+        (Montgomery's trick) and about 3n multiplications"""
+        prefix = []
+        acc = self.one()
+        for element in elements:
+            if element == self.zero():
+                raise ZeroDivisionError("Element 0 has no inverse")
+            prefix.append(acc)
+            acc = acc * element
+
+        acc_inv = acc.inverse()
+        result = [None] * len(elements)
+        for i in range(len(elements) - 1, -1, -1):
+            result[i] = acc_inv * prefix[i]
+            acc_inv = acc_inv * elements[i]
+        return result
+
     def get_elements(self):
         """Generator function for iterating over all elements in Galois Field"""
         a = self.element([1, 0])
@@ -61,15 +118,27 @@ class GaloisField:
         """Returns random element from Galois Field"""
         return self.element([self.base.rand_element() for _ in range(self.m)])
 
+    def rand_poly(self, deg: int):
+        """Returns random polynomial defined over Galois Field"""
+        return self.poly([self.rand_element() for _ in range(deg + 1)])
+
     def hyperelliptic(self, h: RingPolynomial, f: RingPolynomial) -> HC:
         """Returns hyperelliptic curve defined over Galois Field"""
         return HC(self, h, f)
 
+    def _non_residue(self) -> GF_Polynomial:
+        z = self.rand_element()
+        while z.is_quadratic_residue():
+            z = self.rand_element()
+        return z
+
     def _is_field_element(self, value: object) -> bool:
         return isinstance(value, GF_Polynomial) and value.gf == self
 
     def _parse_coeff(self, coeff: list[ZP] | list[int]) -> list[GF_Polynomial]:
-        return list(map(self.element, coeff))
+        return list(
+            map(lambda x: x if self._is_field_element(x) else self.element(x), coeff)
+        )
 
     def __call__(self, value) -> GF_Polynomial:
         if isinstance(value, int) or self.base._is_field_element(value):
@@ -79,6 +148,8 @@ class GaloisField:
         raise ValueError(f"Invalid value for {self} element")
 
     def __eq__(self, other: object):
+        if self is other:
+            return True
         return (
             isinstance(other, GaloisField)
             and self.base == other.base
@@ -0,0 +1,174 @@
+"""(module) containing explicit formulas for divisor arithmetic on genus 2 curves
+y^2 = f(x) over prime fields of odd characteristic (Harley, Lange).
+Divisors are reduced Mumford pairs (u, v) of integer lists ordered from the most
+significant coefficient with monic u of degree at most 2. Formulas return None
+in special cases (u1 and u2 with common root, points of order 2 in support),
+which are left to Cantor's algorithm."""
+
+from .field_context import strip_coeff
+
+
+def _linear(a: list[int]) -> tuple[int, int]:
+    # Coefficients of polynomial of degree at most 1
+    return (0, a[0]) if len(a) == 1 else (a[0], a[1])
+
+
+def genus2_add(p: int, f: list[int], d1, d2):
+    """Sum of reduced divisors with distinct u polynomials or None"""
+    (u1, v1), (u2, v2) = d1, d2
+    if len(u1) < len(u2):
+        (u1, v1), (u2, v2) = (u2, v2), (u1, v1)
+
+    if len(u1) == 3 and len(u2) == 3:
+        return _add_22(p, f, u1, v1, u2, v2)
+    if len(u1) == 3:
+        return _add_21(p, f, u1, v1, u2, v2)
+    return _add_11(p, u1, v1, u2, v2)
+
+
+def genus2_double(p: int, f: list[int], d):
+    """Double of reduced divisor or None"""
+    u, v = d
+    if len(u) == 2:
+        return _double_1(p, f, u, v)
+
+    _, u1, u0 = u
+    v1, v0 = _linear(v)
+    _, f4, f3, f2 = f[:4]
+
+    # k = (f - v^2) / u reduced modulo u
+    k2 = f4 - u1
+    k1 = f3 - u1 * k2 - u0
+    k0 = f2 - v1 * v1 - u1 * k1 - u0 * k2
+    t = k2 - u1
+    w1 = (k1 - u0 - t * u1) % p
+    w0 = (k0 - t * u0) % p
+
+    # Resultant r of u and 2v, almost inverse inv = r / (2v) mod u
+    a, b = 2 * v1, 2 * v0
+    d = b - a * u1
+    r = (b * d + a * a * u0) % p
+    if r == 0:
+        return None
+
+    # s' = r * s = k * inv mod u
+    t = -w1 * a
+    s1 = (w1 * d - w0 * a - t * u1) % p
+    s0 = (w0 * d - t * u0) % p
+    return _compose(p, f, (u1, u0), (v1, v0), (u1, u0), r, s1, s0)
+
+
+def _add_22(p, f, u1, v1, u2, v2):
+    _, u11, u10 = u1
+    _, u21, u20 = u2
+    v11, v10 = _linear(v1)
+    v21, v20 = _linear(v2)
+
+    # u1 mod u2 = a x + b, its resultant r with u2 and almost inverse r / u1 mod u2
+    a = u11 - u21
+    b = u10 - u20
+    d = b - a * u21
+    r = (b * d + a * a * u20) % p
+    if r == 0:
+        return None
+
+    # s' = r * s = (v2 - v1) * inv mod u2
+    w1 = v21 - v11
+    w0 = v20 - v10
+    t = -w1 * a
+    s1 = (w1 * d - w0 * a - t * u21) % p
+    s0 = (w0 * d - t * u20) % p
+    return _compose(p, f, (u11, u10), (v11, v10), (u21, u20), r, s1, s0)
+
+
+def _compose(p, f, u1, v1, u2, r, s1, s0):
+    """Reduced divisor of V = v1 + s * u1 with u = (f - V^2) / (u1 * u2),
+    where s = (s1 * x + s0) / r"""
+    u11, u10 = u1
+    v11, v10 = v1
+    u21, u20 = u2
+    f4 = f[1]
+
+    if s1 == 0:
+        # Constant s, so deg V = 2 and the result has single point
+        s = s0 * pow(r, -1, p) % p
+        n0 = (f4 - s * s - u11 - u21) % p
+        x = -n0
+        value = s * (x * x + u11 * x + u10) + v11 * x + v10
+        return [1, n0], [-value % p]
+
+    # Single inversion gives 1 / s1 and monic s~ = x + s0 / s1
+    w = pow(r * s1, -1, p)
+    rw = r * w % p
+    s0n = s0 * rw % p
+    inv_s = r * rw % p
+    inv_s2 = inv_s * inv_s % p
+    s = s1 * s1 * w % p
+
+    # u' = (s~^2 u1 + 2 s~ v1 / s - k1 / s^2) / u2 with k1 = (f - v1^2) / u1
+    a3 = u11 + 2 * s0n - inv_s2
+    a2 = u10 + s0n * (2 * u11 + s0n) + 2 * v11 * inv_s - (f4 - u11) * inv_s2
+    n1 = (a3 - u21) % p
+    n0 = (a2 - u21 * n1 - u20) % p
+
+    # v' = -(s * s~ u1 + v1) mod u'
+    l2 = u11 + s0n
+    l1 = u10 + s0n * u11
+    l0 = s0n * u10
+    t = l2 - n1
+    m1 = -(s * (l1 - n0 - t * n1) + v11) % p
+    m0 = -(s * (l0 - t * n0) + v10) % p
+    return [1, n1, n0], strip_coeff([m1, m0])
+
+
+def _add_21(p, f, u1, v1, u2, v2):
+    _, u11, u10 = u1
+    v11, v10 = _linear(v1)
+    u20, v20 = u2[1], v2[0]
+    _, f4, f3 = f[:3]
+
+    # Line through points is replaced by V = v1 + s * u1 with constant s
+    x = -u20
+    a = (x * x + u11 * x + u10) % p
+    if a == 0:
+        return None
+    s = (v20 - v11 * x - v10) * pow(a, -1, p) % p
+
+    # V = s x^2 + q1 x + q0, u' = (f - V^2) / (u1 * u2) needs only top coefficients
+    q1 = v11 + s * u11
+    q0 = v10 + s * u10
+    c2 = u11 + u20
+    c1 = u10 + u11 * u20
+    n1 = (f4 - s * s - c2) % p
+    n0 = (f3 - 2 * s * q1 - c2 * n1 - c1) % p
+
+    m1 = -(q1 - s * n1) % p
+    m0 = -(q0 - s * n0) % p
+    return [1, n1, n0], strip_coeff([m1, m0])
+
+
+def _add_11(p, u1, v1, u2, v2):
+    u10, v10 = u1[1], v1[0]
+    u20, v20 = u2[1], v2[0]
+    if (u10 - u20) % p == 0:
+        return None
+
+    # Line through both points
+    s = (v20 - v10) * pow(u10 - u20, -1, p) % p
+    u = [1, (u10 + u20) % p, u10 * u20 % p]
+    return u, strip_coeff([s, (v10 + s * u10) % p])
+
+
+def _double_1(p, f, u, v):
+    u0, v0 = u[1], v[0]
+    if v0 == 0:
+        return [1], [0]
+
+    # Tangent line at point (x, v0) has slope f'(x) / (2 * v0)
+    x = -u0
+    derivative = 0
+    for i, c in enumerate(f[:-1]):
+        derivative = derivative * x + (5 - i) * c
+    s = derivative * pow(2 * v0, -1, p) % p
+    u = [1, 2 * u0 % p, u0 * u0 % p]
+    return u, strip_coeff([s, (v0 + s * u0) % p])
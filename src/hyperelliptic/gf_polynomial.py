@@ -10,8 +10,8 @@ class GF_Polynomial(Polynomial):
         self.gf = field
         super().__init__(coeff, symbol)
 
-        if self.deg >= field._poly.deg:
-            self.coeff = (self % field._poly).coeff
+        if self.deg >= field.modulus.deg:
+            self.coeff = field.modulus.reduce(self).coeff
 
     def coeff_zero(self):
         return self.gf.base.zero()
@@ -19,8 +19,16 @@ class GF_Polynomial(Polynomial):
     def coeff_one(self):
         return self.gf.base.one()
 
+    def _int_ctx(self):
+        return self.gf.base.ctx
+
+    def _characteristic(self):
+        return self.gf.p
+
     def inverse(self):
         """Find inverse y of an element x such that x^{-1} = y and xy = 1"""
+        if self.gf.tables is not None:
+            return self.gf.tables.inverse(self)
         if self == self.zero():
             raise ZeroDivisionError("Element 0 has no inverse")
 
@@ -31,54 +39,23 @@ class GF_Polynomial(Polynomial):
 
     def sqrt(self):
         """Find square root y of element x such that y^{2} = x"""
-        # Handle special case of char(2) fields
-        if self.gf.p == 2:
-            return pow(self, self.gf.q // 2)
-
-        # Tonelli-Shanks algorithm
-        if not self.is_quadratic_residue():
+        root = self.try_sqrt()
+        if root is None:
             raise ValueError(f"Argument {self} has no square root")
+        return root
 
-        if self == self.zero():
-            return self.zero()
-
-        p = self.gf.q
-        q = p - 1
-        s = 0  # S must be an integer, not ZP
-
-        # find Q and S such that p - 1 = Q * 2^S
-        while q % 2 == 0:
-            q //= 2
-            s += 1
-
-        if s == 1:
-            return pow(self, (p + 1) // 4)
-
-        # Find z that is not quadratic residue
-        z = self.gf.rand_element()
-        while z.is_quadratic_residue():
-            z = self.gf.rand_element()
-
-        c = pow(z, q)
-        t = pow(self, q)
-        r = pow(self, (q + 1) // 2)
-        m = s
-
-        while t != 1:
-            # Find the least i such that t^2^i = 1
-            i = 1
-            while pow(t, pow(2, i)) != 1:
-                i += 1
-
-            b = pow(c, pow(2, m - i - 1))
-            m = i
-            c = pow(b, 2)
-            t = t * c
-            r = r * b
-        return r
+    def try_sqrt(self):
+        """Square root of an element or None if element is not a quadratic residue"""
+        if self.gf.tables is not None:
+            if not self.gf.tables.is_quadratic_residue(self):
+                return None
+            return self.gf.tables.sqrt(self)
+        return self.gf.sqrt_ctx.sqrt(self)
 
     def is_quadratic_residue(self):
         """Returns true if square root of element exists"""
+        if self.gf.tables is not None:
+            return self.gf.tables.is_quadratic_residue(self)
         return self.legendre() == self.one() or self == self.zero()
 
     def legendre(self):
@@ -88,6 +65,24 @@ class GF_Polynomial(Polynomial):
     def _from_coeff(self, coeff):
         return GF_Polynomial(self.gf, coeff, self.symbol)
 
+    def _uses_tables(self, other):
+        tables = self.gf.tables
+        return (
+            tables is not None
+            and isinstance(other, GF_Polynomial)
+            and (other.gf is self.gf or other.gf == self.gf)
+        )
+
+    def __mul__(self, other):
+        if self._uses_tables(other):
+            return self.gf.tables.mul(self, other)
+        return super().__mul__(other)
+
+    def __pow__(self, other, mod=None):
+        if mod is None and self.gf.tables is not None and isinstance(other, int):
+            return self.gf.tables.pow(self, other)
+        return super().__pow__(other, mod)
+
     def __truediv__(self, other):
         if isinstance(other, GF_Polynomial):
             return self * other.inverse()
@@ -0,0 +1,94 @@
+"""(module) containing subquadratic half-GCD algorithm for integer polynomials.
+Polynomials are lists ordered from the most significant coefficient and all
+arithmetic is done by FieldContext. Euclidean steps are accumulated in
+2x2 matrices (m00, m01, m10, m11) acting on pairs of polynomials."""
+
+# Below this degree half-GCD performs classical Euclidean steps
+CLASSICAL_THRESHOLD = 64
+
+
+def _deg(a: list[int]) -> int:
+    return -1 if a == [0] else len(a) - 1
+
+
+def _shift(a: list[int], k: int) -> list[int]:
+    # Quotient of division by x^k
+    return a[: len(a) - k] if len(a) > k else [0]
+
+
+def _identity():
+    return [1], [0], [0], [1]
+
+
+def _apply(ctx, m, a: list[int], b: list[int]):
+    m00, m01, m10, m11 = m
+    return (
+        ctx.poly_add(ctx.poly_mul(m00, a), ctx.poly_mul(m01, b)),
+        ctx.poly_add(ctx.poly_mul(m10, a), ctx.poly_mul(m11, b)),
+    )
+
+
+def _compose(ctx, m, n):
+    # Product of matrices m * n
+    m00, m01, m10, m11 = m
+    n00, n01, n10, n11 = n
+    return (
+        ctx.poly_add(ctx.poly_mul(m00, n00), ctx.poly_mul(m01, n10)),
+        ctx.poly_add(ctx.poly_mul(m00, n01), ctx.poly_mul(m01, n11)),
+        ctx.poly_add(ctx.poly_mul(m10, n00), ctx.poly_mul(m11, n10)),
+        ctx.poly_add(ctx.poly_mul(m10, n01), ctx.poly_mul(m11, n11)),
+    )
+
+
+def _step(ctx, m, a: list[int], b: list[int]):
+    # Single Euclidean step (a, b) -> (b, a mod b) composed into matrix m
+    q, r = ctx.poly_divmod(a, b)
+    m00, m01, m10, m11 = m
+    m = (
+        m10,
+        m11,
+        ctx.poly_sub(m00, ctx.poly_mul(q, m10)),
+        ctx.poly_sub(m01, ctx.poly_mul(q, m11)),
+    )
+    return m, b, r
+
+
+def half_gcd(ctx, a: list[int], b: list[int]):
+    """Matrix of Euclidean steps reducing (a, b), deg a > deg b, to pair of
+    consecutive remainders (c, d) with deg c >= ceil(deg a / 2) > deg d"""
+    m = (_deg(a) + 1) // 2
+    if _deg(b) < m:
+        return _identity()
+
+    if _deg(a) < CLASSICAL_THRESHOLD:
+        matrix = _identity()
+        while _deg(b) >= m:
+            matrix, a, b = _step(ctx, matrix, a, b)
+        return matrix
+
+    matrix = half_gcd(ctx, _shift(a, m), _shift(b, m))
+    c, d = _apply(ctx, matrix, a, b)
+    if _deg(d) < m:
+        return matrix
+
+    matrix, c, d = _step(ctx, matrix, c, d)
+    if _deg(d) < m:
+        return matrix
+
+    k = 2 * m - _deg(c)
+    return _compose(ctx, half_gcd(ctx, _shift(c, k), _shift(d, k)), matrix)
+
+
+def hgcd_xgcd(ctx, a: list[int], b: list[int]):
+    """Returns (g, s, t) such that g = s * a + t * b is gcd of a and b
+    (not normalized). Reduction is driven by half-GCD matrices."""
+    matrix = _identity()
+    while b != [0]:
+        matrix, a, b = _step(ctx, matrix, a, b)
+        if b == [0]:
+            break
+        step = half_gcd(ctx, a, b)
+        a, b = _apply(ctx, step, a, b)
+        matrix = _compose(ctx, step, matrix)
+
+    return a, matrix[0], matrix[1]
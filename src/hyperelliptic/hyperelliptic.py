@@ -1,13 +1,50 @@
 """(module) containing HC [hyperelliptic curve] class"""
 
+from collections import Counter
 from random import randint
 from .integer import ZP
 from .utils import gf_operation
 from .polynomial import Polynomial
+from .field_array import array_supported
+from .genus2 import genus2_add, genus2_double
+from .subproduct_tree import SubproductTree
 
 INF_POINT = ("Inf", "Inf")
 
 
+def _linear_tree(gf, xs):
+    """Levels of subproduct tree of linear factors (x - x_i), root is the last level"""
+    level = [gf.poly([gf.one(), -x]) for x in xs]
+    levels = [level]
+    while len(level) > 1:
+        level = [
+            level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        levels.append(level)
+    return levels
+
+
+def _interpolate(gf, xs, ys):
+    """Returns product of (x - x_i) and polynomial interpolating points (x_i, y_i)"""
+    levels = _linear_tree(gf, xs)
+    root = levels[-1][0]
+    # Barycentric weights 1 / m'(x_i) with single field inversion
+    weights = gf.batch_inverse(root.derivative().evaluate_many(xs))
+
+    terms = [gf.poly([w * y]) for y, w in zip(ys, weights)]
+    for level in levels[:-1]:
+        terms = [
+            (
+                terms[i] * level[i + 1] + terms[i + 1] * level[i]
+                if i + 1 < len(level)
+                else terms[i]
+            )
+            for i in range(0, len(level), 2)
+        ]
+    return root, terms[0]
+
+
 class HC:
     """Class implementing hyperelliptic curve"""
 
@@ -26,6 +63,11 @@ class HC:
         if gf.p != 2 and h != 0:
             raise ValueError("h(x) must be 0 for char(F) != 2")
 
+        # Genus 2 curves y^2 = f(x) over prime fields use explicit formulas
+        self._explicit_f = None
+        if self.g == 2 and h == 0 and gf.p != 2 and isinstance(gf.zero(), ZP):
+            self._explicit_f = f._to_ints()  # pylint: disable=W0212
+
     def divisor(self, a: Polynomial, b: Polynomial):
         """Get divisor (element of a group defined by the curve)
         defined by polynomials a and b provided in arguments"""
@@ -75,13 +117,18 @@ class HC:
         return list(map(lambda p: p[1], points))
 
     def _point_from_x(self, x: tuple[int, int]):
+        return self._point_from_values(x, self.h(x), self.f(x))
+
+    def _point_from_values(self, x, hx, fx):
         # NOTE: This formula works only for fields of characteristic != 2
-        hx = self.h(x)
-        fx = self.f(x)
         discriminant = hx * hx + 4 * fx
-        if not discriminant.is_quadratic_residue():
+        # Non-residues are rejected by Jacobi symbol, cheaper than an exponentiation
+        if isinstance(discriminant, ZP) and discriminant.jacobi() == -1:
             return None
-        y1 = (-hx + discriminant.sqrt()) / self.gf(2)
+        root = discriminant.try_sqrt()
+        if root is None:
+            return None
+        y1 = (-hx + root) / self.gf(2)
         y2 = -y1 - hx
         y = y1 if randint(0, 1) == 0 else y2
         return (x, y)
@@ -89,8 +136,11 @@ class HC:
     def get_all_points(self):
         """Get all points lying on a curve"""
         result = [INF_POINT]
-        for x in self.gf.get_elements():
-            point = self._point_from_x(x)
+        xs = list(self._candidate_xs())
+        # Values at all candidates are computed at once with multipoint evaluation
+        hs, fs = self.h.evaluate_many(xs), self.f.evaluate_many(xs)
+        for x, hx, fx in zip(xs, hs, fs):
+            point = self._point_from_values(x, hx, fx)
             if point is None:
                 continue
 
@@ -100,6 +150,19 @@ class HC:
                 result.append(inverse)
         return result
 
+    def _candidate_xs(self):
+        """x-coordinates for which points might exist. Over small prime fields
+        x without square root of discriminant are filtered out in bulk"""
+        xs = self.gf.get_elements()
+        if not isinstance(self.gf.zero(), ZP) or not array_supported(self.gf.p):
+            return xs
+
+        x = self.gf.array(xs)
+        hx = self.h(x)
+        discriminant = hx * hx + 4 * self.f(x)
+        mask = discriminant.is_quadratic_residue()
+        return [int(v) for v in x.values[mask]]
+
     def __str__(self):
         return f"C: y^2 + ({str(self.h)})y = {str(self.f)}"
 
@@ -119,27 +182,27 @@ class Divisor:
     def from_points(curve: HC, points: list[tuple[int, int]]):
         """Get divisor in mumford representation from point representation"""
         # pylint: disable=W0212
-        # Find first polynomial of Mumford representation
-        valid_points = list(filter(lambda p: p != INF_POINT, points))
+        valid_points = [p for p in points if p != INF_POINT]
         gf = curve.gf
-        u = gf.poly([gf.one()])
-        for x in curve._x_from_points(valid_points):
-            u *= gf.poly([gf(1), -x])
-
-        valid_unique_points = list(set(valid_points))
-        p_x = curve._x_from_points(valid_unique_points)
-        p_y = curve._y_from_points(valid_unique_points)
-
-        # Find second polynomial via Lagrange interpolation
-        # pylint: disable=C0200
-        v = gf.poly([gf.zero()])
-        for i in range(len(p_y)):
-            tmp = gf.poly([gf.one()])
-            for j in range(len(p_x)):
-                if j == i:
-                    continue
-                tmp *= gf.poly([gf(1), -p_x[j]]) / (p_x[i] - p_x[j])
-            v += tmp * p_y[i]
+        counts = Counter(valid_points)
+        p_x = curve._x_from_points(list(counts))
+        p_y = curve._y_from_points(list(counts))
+
+        # First polynomial of Mumford representation is the root of subproduct
+        # tree of unique points which also drives interpolation of the second one
+        if not p_x:
+            u, v = gf.poly([gf.one()]), gf.poly([gf.zero()])
+        elif isinstance(gf.zero(), ZP):
+            tree = SubproductTree(gf.ctx, [gf.element(x).value for x in p_x])
+            v = tree.interpolate([gf.element(y).value for y in p_y])
+            u, v = gf.poly(tree.root), gf.poly(v)
+        else:
+            u, v = _interpolate(gf, p_x, p_y)
+
+        # Points repeated in support contribute to u with multiplicity
+        repeated = [x for (x, _), k in counts.items() for _ in range(k - 1)]
+        if repeated:
+            u *= _linear_tree(gf, repeated)[-1][0]
 
         return Divisor(curve, u, v)
 
@@ -150,23 +213,26 @@ class Divisor:
             curve, curve.gf.poly([curve.gf.one()]), curve.gf.poly([curve.gf.zero()])
         )
 
+    def is_zero(self):
+        """Check if divisor is neutral for addition without building zero divisor"""
+        return self.u == 1 and self.v == 0
+
     @property
     def points(self):
         """Compute point representation of divisor.
-        This might require factorization of polynomials
-        describing mumford representation and therefore be computationally expensive
+        x-coordinates are roots of the first polynomial of mumford representation,
+        which costs one modular exponentiation and random splitting
         """
         # pylint: disable=W0201
-        # Apply memoization of _points property and avoid recomputation of factors
+        # Apply memoization of _points property and avoid recomputation of roots
         if hasattr(self, "_points"):
             # pylint: disable=E0203
             return self._points
 
         c, u, v = self.c, self.u, self.v
-        u_factors = u.factors()
-        if len(u_factors) < u.deg:
+        roots = u.roots()
+        if len(roots) < u.deg:
             raise ValueError("Divisor has non F-rational points in supp")
-        roots = [-factor.coeff[-1] for factor in u_factors]
         points = [c._point_from_x(root) for root in roots]
         valid_points = [p if v(p[0]) == p[1] else c.point_inverse(p) for p in points]
         # fill missing g-tuple entries with infinity points
@@ -178,11 +244,10 @@ class Divisor:
         """Algorithm taking a divisor into its reduced form"""
         u, v, f, h, g = self.u, self.v, self.c.f, self.c.h, self.c.g
 
-        _u = (f - v * h - v * v) // u
-        _v = (-h - v) % _u
+        _u, _v = u, v
         while _u.deg > g:
-            _u = (f - v * h - v * v) // _u
-            _v = (-h - v) % _u
+            _u = (f - _v * h - _v * _v) // _u
+            _v = (-h - _v) % _u
 
         _u = _u.to_monic()
 
@@ -190,11 +255,15 @@ class Divisor:
 
     @gf_operation
     def __add__(self, other: "Divisor"):
-        if self == Divisor.zero(self.c):
+        if self.is_zero():
             return other
-        if other == Divisor.zero(self.c):
+        if other.is_zero():
             return self
 
+        result = self._explicit_add(other)
+        if result is not None:
+            return result
+
         u1, u2, v1, v2 = self.u, other.u, self.v, other.v
         d1, e1, e2 = u1.xgcd(u2)
         d, c1, c2 = d1.xgcd(v1 + v2 + self.c.h)
@@ -206,6 +275,38 @@ class Divisor:
 
         return Divisor(self.c, u, v).to_reduced()
 
+    def _explicit_add(self, other: "Divisor"):
+        """Sum of reduced divisors on genus 2 curve computed with explicit
+        formulas, None if formulas do not apply"""
+        # pylint: disable=W0212
+        f = self.c._explicit_f
+        if f is None or not (self._is_reduced() and other._is_reduced()):
+            return None
+
+        p = self.gf.p
+        d1 = (self.u._to_ints(), self.v._to_ints())
+        d2 = (other.u._to_ints(), other.v._to_ints())
+        if d1[0] != d2[0]:
+            result = genus2_add(p, f, d1, d2)
+        elif d1[1] == d2[1]:
+            result = genus2_double(p, f, d1)
+        elif len(d1[1]) == len(d2[1]) and all(
+            (a + b) % p == 0 for a, b in zip(d1[1], d2[1])
+        ):
+            return Divisor.zero(self.c)
+        else:
+            result = None
+
+        if result is None:
+            return None
+        u, v = result
+        return Divisor(self.c, self.u._from_ints(u), self.v._from_ints(v))
+
+    def _is_reduced(self):
+        # Explicit formulas need monic u of degree at most genus and deg v < deg u
+        u, v = self.u, self.v
+        return u.deg <= self.c.g and v.deg < u.deg and u.leading_coeff == 1
+
     def __mul__(self, other: "Divisor"):
         if not isinstance(other, int) and not isinstance(other, ZP):
             raise ValueError(f"Divisor cannot be multiplied by {other}")
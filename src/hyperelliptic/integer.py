@@ -2,7 +2,7 @@
 
 import math
 
-from .utils import gf_operation
+from .utils import gf_operation, jacobi
 
 
 class ZP:
@@ -43,53 +43,26 @@ class ZP:
         return self._from_value(r1), self._from_value(s1), self._from_value(t1)
 
     def sqrt(self):
-        """Tonelli-Shanks algorithm"""
-        if not self.is_quadratic_residue():
+        """Find square root y of element x such that y^{2} = x"""
+        root = self.try_sqrt()
+        if root is None:
             raise ValueError(f"Argument {self} has no square root")
+        return root
 
-        if self == self.zero():
-            return self.zero()
-
-        p = self.p
-        q = p - 1
-        s = 0  # S must be an integer, not ZP
-
-        # find Q and S such that p - 1 = Q * 2^S
-        while q % 2 == 0:
-            q //= 2
-            s += 1
-
-        if s == 1:
-            return pow(self, (p + 1) // 4)
-
-        # Find z that is not quadratic residue
-        z = self.one()
-        while z.is_quadratic_residue():
-            z += 1
-
-        c = pow(z, q)
-        t = pow(self, q)
-        r = pow(self, (q + 1) // 2)
-        m = s
-
-        while t != 1:
-            # Find the least i such that t^2^i = 1
-            i = 1
-            while pow(t, pow(2, i)) != 1:
-                i += 1
-
-            b = pow(c, pow(2, m - i - 1))
-            m = i
-            c = pow(b, 2)
-            t = t * c
-            r = r * b
-        return r
+    def try_sqrt(self):
+        """Square root of an element or None if element is not a quadratic residue"""
+        root = self.gf.sqrt_ctx.sqrt(self.value)
+        return None if root is None else self._from_value(root)
 
     def is_quadratic_residue(self):
         """Returns true if square root of element exists"""
-        if self.legendre() == self.one() or self == self.zero():
-            return True
-        return False
+        return self.jacobi() != -1
+
+    def jacobi(self):
+        """Jacobi (Legendre) symbol of an element as an integer -1, 0 or 1"""
+        if self.p == 2:
+            return self.value
+        return jacobi(self.value, self.p)
 
     def legendre(self):
         """Legendre symbol of an element"""
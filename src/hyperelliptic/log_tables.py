@@ -0,0 +1,137 @@
+"""(module) containing log/antilog tables for arithmetic in small Galois Fields"""
+
+# Largest field order for which tables are built
+MAX_TABLE_ORDER = 2**20
+
+
+class LogTables:
+    """Discrete logarithm (log) and exponent (antilog) tables of Galois Field
+    with respect to its primitive element. Elements are encoded as integers
+    sum(c_i * p^i), the same way GF_Polynomial is hashed."""
+
+    def __init__(self, gf) -> None:
+        if gf.q > MAX_TABLE_ORDER:
+            raise ValueError(f"Field of order {gf.q} is too big for log tables")
+
+        self.gf = gf
+        self.p: int = gf.p
+        self.m: int = gf.m
+        self.q: int = gf.q
+        self.order: int = gf.q - 1
+
+        poly = gf._poly  # pylint: disable=protected-access
+        lead_inv = pow(poly.leading_coeff.value, -1, self.p)
+        # Little endian coefficients of monic modulus without leading term
+        self._modulus = [c.value * lead_inv % self.p for c in poly.coeff[::-1]][:-1]
+
+        self.generator, self.antilog = self._find_generator()
+        self.log = [-1] * self.q
+        for k, index in enumerate(self.antilog):
+            self.log[index] = k
+
+    def encode(self, element) -> int:
+        """Integer index of field element"""
+        index = 0
+        for c in element.coeff:
+            index = index * self.p + c.value
+        return index
+
+    def decode(self, index: int):
+        """Field element with given integer index"""
+        coeff = []
+        while index:
+            index, c = divmod(index, self.p)
+            coeff.append(c)
+        return self.gf.element(coeff[::-1] or [0])
+
+    def mul(self, a, b):
+        """Product of two field elements"""
+        i, j = self.encode(a), self.encode(b)
+        if i == 0 or j == 0:
+            return self.gf.zero()
+        return self.decode(self.antilog[(self.log[i] + self.log[j]) % self.order])
+
+    def inverse(self, a):
+        """Multiplicative inverse of field element"""
+        i = self.encode(a)
+        if i == 0:
+            raise ZeroDivisionError("Element 0 has no inverse")
+        return self.decode(self.antilog[-self.log[i] % self.order])
+
+    def pow(self, a, exp: int):
+        """Power of field element"""
+        i = self.encode(a)
+        if i == 0:
+            if exp < 0:
+                raise ZeroDivisionError("Element 0 has no inverse")
+            return self.gf.one() if exp == 0 else self.gf.zero()
+        return self.decode(self.antilog[self.log[i] * exp % self.order])
+
+    def is_quadratic_residue(self, a) -> bool:
+        """Check if square root of element exists"""
+        i = self.encode(a)
+        return i == 0 or self.p == 2 or self.log[i] % 2 == 0
+
+    def sqrt(self, a):
+        """Square root of field element"""
+        i = self.encode(a)
+        if i == 0:
+            return self.gf.zero()
+        k = self.log[i]
+        if self.p == 2:
+            # q - 1 is odd and q / 2 is inverse of 2 modulo q - 1
+            return self.decode(self.antilog[k * (self.q // 2) % self.order])
+        if k % 2 == 1:
+            raise ValueError(f"Argument {a} has no square root")
+        return self.decode(self.antilog[k // 2])
+
+    def _mul_x(self, vec: list[int]) -> list[int]:
+        # Multiply little endian vector by x modulo the field polynomial
+        top = vec[-1]
+        shifted = [0] + vec[:-1]
+        if top == 0:
+            return shifted
+        p = self.p
+        return [(c - top * r) % p for c, r in zip(shifted, self._modulus)]
+
+    def _mul_vec(self, vec: list[int], g: list[int]) -> list[int]:
+        # Horner scheme keeps multiplication by low degree generators cheap
+        p = self.p
+        result = [0] * self.m
+        for gj in reversed(g):
+            result = self._mul_x(result)
+            if gj:
+                result = [(r + gj * v) % p for r, v in zip(result, vec)]
+        return result
+
+    def _index(self, vec: list[int]) -> int:
+        index = 0
+        for c in reversed(vec):
+            index = index * self.p + c
+        return index
+
+    def _powers(self, g: list[int]) -> list[int] | None:
+        # Indices of consecutive powers of g, None if g is not primitive
+        vec = [1] + [0] * (self.m - 1)
+        powers = [1]
+        for _ in range(self.order - 1):
+            vec = self._mul_vec(vec, g)
+            index = self._index(vec)
+            if index == 1:
+                return None
+            powers.append(index)
+        return powers
+
+    def _find_generator(self):
+        cofactors = [self.order // r for r in self.gf.order_factors()]
+        one = self.gf.one()
+
+        for index in range(self.p if self.m > 1 else 2, self.q):
+            candidate = self.decode(index)
+            if any(candidate**e == one for e in cofactors):
+                continue
+            g = [c.value for c in candidate.coeff[::-1]]
+            powers = self._powers(g)
+            if powers is not None:
+                return candidate, powers
+        raise ValueError(f"{self.gf} has no primitive element")
@@ -0,0 +1,129 @@
+"""(module) containing polynomial multiplication algorithms on coefficient lists.
+Functions with _le suffix work on little endian lists (constant term first)."""
+
+# Operands shorter than this are multiplied with schoolbook method
+KARATSUBA_THRESHOLD = 16
+
+# Operands longer than this are multiplied with Toom-3 method
+TOOM3_THRESHOLD = 96
+
+
+def _add_le(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b) :]
+
+
+def _sub_le(a, b):
+    if len(a) >= len(b):
+        return [x - y for x, y in zip(a, b)] + a[len(b) :]
+    return [x - y for x, y in zip(a, b)] + [-y for y in b[len(a) :]]
+
+
+def _add_shifted_le(result, a, shift):
+    # result += a * x^shift, in place
+    for i, c in enumerate(a):
+        result[i + shift] = result[i + shift] + c
+
+
+def schoolbook_le(a, b, zero):
+    """Schoolbook product of two little endian coefficient lists"""
+    result = [zero] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x == 0:
+            continue
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+
+def karatsuba_le(a, b, zero, threshold=KARATSUBA_THRESHOLD):
+    """Karatsuba product of two little endian coefficient lists"""
+    if min(len(a), len(b)) < threshold:
+        return schoolbook_le(a, b, zero)
+
+    k = max(len(a), len(b)) // 2
+    result = [zero] * (len(a) + len(b) - 1)
+    a0, a1 = a[:k], a[k:]
+    b0, b1 = b[:k], b[k:]
+
+    if not a1 or not b1:
+        # Unbalanced operands, split only the longer one
+        long, short = (a, b) if len(a) >= len(b) else (b, a)
+        _add_shifted_le(result, karatsuba_le(long[:k], short, zero, threshold), 0)
+        _add_shifted_le(result, karatsuba_le(long[k:], short, zero, threshold), k)
+        return result
+
+    z0 = karatsuba_le(a0, b0, zero, threshold)
+    z2 = karatsuba_le(a1, b1, zero, threshold)
+    z1 = karatsuba_le(_add_le(a0, a1), _add_le(b0, b1), zero, threshold)
+    z1 = _sub_le(_sub_le(z1, z0), z2)
+
+    _add_shifted_le(result, z0, 0)
+    _add_shifted_le(result, z1[: len(result) - k], k)
+    _add_shifted_le(result, z2, 2 * k)
+    return result
+
+
+def toom3_le(
+    a,
+    b,
+    zero,
+    exact_div,
+    threshold=TOOM3_THRESHOLD,
+    karatsuba_threshold=KARATSUBA_THRESHOLD,
+):
+    """Toom-3 product of two little endian coefficient lists.
+    exact_div(c, k) must divide coefficient c by small integer k (2 or 3)"""
+    k = (max(len(a), len(b)) + 2) // 3
+    if min(len(a), len(b)) < max(threshold, 2 * k + 1):
+        return karatsuba_le(a, b, zero, karatsuba_threshold)
+
+    def evaluate(u):
+        u0, u1, u2 = u[:k], u[k : 2 * k], u[2 * k :]
+        u02 = _add_le(u0, u2)
+        return [
+            u0,
+            _add_le(u02, u1),
+            _sub_le(u02, u1),
+            _sub_le(_add_le(u0, [4 * c for c in u2]), [2 * c for c in u1]),
+            u2,
+        ]
+
+    def mul(u, v):
+        return toom3_le(u, v, zero, exact_div, threshold, karatsuba_threshold)
+
+    # Values at 0, 1, -1, -2 and infinity
+    r0, r1, rm1, rm2, rinf = [mul(u, v) for u, v in zip(evaluate(a), evaluate(b))]
+
+    # Bodrato's interpolation sequence
+    c3 = [exact_div(c, 3) for c in _sub_le(rm2, r1)]
+    c1 = [exact_div(c, 2) for c in _sub_le(r1, rm1)]
+    c2 = _sub_le(rm1, r0)
+    c3 = _add_le([exact_div(c, 2) for c in _sub_le(c2, c3)], [2 * c for c in rinf])
+    c2 = _sub_le(_add_le(c2, c1), rinf)
+    c1 = _sub_le(c1, c3)
+
+    result = [zero] * (len(a) + len(b) - 1)
+    for i, part in enumerate([r0, c1, c2, c3, rinf]):
+        # Parts can carry trailing zeros beyond the product degree
+        _add_shifted_le(result, part[: len(result) - i * k], i * k)
+    return result
+
+
+def multiply(
+    a,
+    b,
+    zero,
+    exact_div=None,
+    karatsuba_threshold=KARATSUBA_THRESHOLD,
+    toom3_threshold=TOOM3_THRESHOLD,
+):
+    """Product of two coefficient lists ordered from the most significant coefficient.
+    Toom-3 is used only if exact_div is provided."""
+    a, b = a[::-1], b[::-1]
+    if exact_div is not None and min(len(a), len(b)) >= toom3_threshold:
+        result = toom3_le(a, b, zero, exact_div, toom3_threshold, karatsuba_threshold)
+    else:
+        result = karatsuba_le(a, b, zero, karatsuba_threshold)
+    return result[::-1]
@@ -0,0 +1,153 @@
+"""(module) containing number theoretic transform multiplication of polynomials"""
+
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .factorization import factorize
+from .field_array import MAX_ARRAY_PRIME
+from .utils import is_prime
+
+# Transforms of length up to 2^MAX_NTT_LOG are supported for arbitrary primes
+MAX_NTT_LOG = 20
+
+# Primes of form c * 2^MAX_NTT_LOG + 1 below MAX_ARRAY_PRIME, in descending order
+_ntt_primes: list[int] = []
+
+
+def ntt_supported(p: int, size: int) -> bool:
+    """Check if product of size coefficients over prime field can use NTT"""
+    if np is None:
+        return False
+    n = 1 << (size - 1).bit_length()
+    return _is_ntt_friendly(p, n) or n <= 2**MAX_NTT_LOG
+
+
+def _is_ntt_friendly(p: int, n: int) -> bool:
+    # Transform of length n exists modulo p and fits in int64 arithmetic
+    return 2 < p < MAX_ARRAY_PRIME and (p - 1) % n == 0
+
+
+@lru_cache(maxsize=None)
+def _primitive_root(q: int) -> int:
+    cofactors = [(q - 1) // r for r in factorize(q - 1)]
+    g = 2
+    while any(pow(g, e, q) == 1 for e in cofactors):
+        g += 1
+    return g
+
+
+def _crt_primes(bound: int) -> list[int]:
+    """NTT primes with product exceeding bound"""
+    result, product = [], 1
+    for q in _ntt_primes:
+        if product > bound:
+            return result
+        result.append(q)
+        product *= q
+
+    # Continue search below the smallest prime found so far
+    top = _ntt_primes[-1] if _ntt_primes else MAX_ARRAY_PRIME
+    c = (top - 1 >> MAX_NTT_LOG) - 1
+    while product <= bound:
+        if c == 0:
+            raise ValueError(f"Not enough NTT primes to exceed {bound}")
+        q = (c << MAX_NTT_LOG) + 1
+        if is_prime(q):
+            _ntt_primes.append(q)
+            result.append(q)
+            product *= q
+        c -= 1
+    return result
+
+
+def _twiddles(w: int, half: int, q: int):
+    # Powers w^k for k < half built with log(half) vectorized steps
+    powers = np.ones(1, dtype=np.int64)
+    while len(powers) < half:
+        step = pow(w, len(powers), q)
+        powers = np.concatenate([powers, powers * step % q])
+    return powers[:half]
+
+
+def _bit_reverse(n: int):
+    log = n.bit_length() - 1
+    index = np.arange(n)
+    result = np.zeros(n, dtype=np.int64)
+    for bit in range(log):
+        result |= ((index >> bit) & 1) << (log - 1 - bit)
+    return result
+
+
+def _transform(values, q: int, root: int, inverse: bool = False):
+    """Iterative radix-2 NTT of array whose length is a power of 2"""
+    n = len(values)
+    w = pow(root, (q - 1) // n, q)
+    if inverse:
+        w = pow(w, -1, q)
+    twiddles = _twiddles(w, max(n // 2, 1), q)
+
+    a = values[_bit_reverse(n)]
+    length = 2
+    while length <= n:
+        half = length // 2
+        blocks = a.reshape(-1, length)
+        u = blocks[:, :half]
+        v = blocks[:, half:] * twiddles[:: n // length] % q
+        a = np.concatenate([(u + v) % q, (u - v) % q], axis=1).reshape(-1)
+        length *= 2
+
+    if inverse:
+        a = a * pow(n, -1, q) % q
+    return a
+
+
+def _convolve(a: list[int], b: list[int], q: int, n: int):
+    root = _primitive_root(q)
+    fa = _transform(_padded(a, q, n), q, root)
+    fb = fa if b is a else _transform(_padded(b, q, n), q, root)
+    return _transform(fa * fb % q, q, root, inverse=True)
+
+
+def _padded(a: list[int], q: int, n: int):
+    result = np.zeros(n, dtype=np.int64)
+    result[: len(a)] = np.array([c % q for c in a], dtype=np.int64)
+    return result
+
+
+def ntt_multiply(a: list[int], b: list[int], p: int) -> list[int]:
+    """Product of polynomials with coefficients reduced modulo prime p.
+    Lists are ordered from the most significant coefficient. Transform is done
+    directly modulo NTT-friendly p, otherwise modulo several NTT primes
+    and coefficients are recovered with Chinese remainder theorem."""
+    if np is None:
+        raise ImportError("NTT multiplication requires numpy to be installed")
+
+    size = len(a) + len(b) - 1
+    n = 1 << (size - 1).bit_length()
+    a_le = a[::-1]
+    b_le = a_le if b is a else b[::-1]
+
+    if _is_ntt_friendly(p, n):
+        return _convolve(a_le, b_le, p, n)[:size][::-1].tolist()
+
+    if n > 2**MAX_NTT_LOG:
+        raise ValueError(f"NTT of length {n} is not supported modulo {p}")
+
+    # Coefficients of product over integers are below the bound
+    bound = min(len(a), len(b)) * (p - 1) ** 2
+    primes = _crt_primes(bound)
+    residues = [_convolve(a_le, b_le, q, n)[:size].tolist() for q in primes]
+
+    # Garner's mixed radix reconstruction
+    modulus, result = 1, [0] * size
+    for q, r in zip(primes, residues):
+        modulus_inv = pow(modulus, -1, q)
+        for i, c in enumerate(result):
+            t = (r[i] - c) * modulus_inv % q
+            result[i] = c + modulus * t
+        modulus *= q
+    return [c % p for c in result[::-1]]
@@ -0,0 +1,122 @@
+"""(module) containing precomputed polynomial modulus for repeated reductions"""
+
+from .field_context import strip_coeff
+
+# Dense moduli of at least this degree are reduced with Newton inverse
+NEWTON_THRESHOLD = 32
+
+# Moduli with at most this many nonzero terms are reduced term by term
+MAX_SPARSE_TERMS = 5
+
+
+class PolyModulus:
+    """Modulus for fast repeated reductions of polynomials over prime field.
+    Dense moduli keep power series inverse of reversed modulus (computed with
+    Newton iteration), so each reduction costs two multiplications.
+    Sparse moduli (trinomials, pentanomials) are reduced by folding
+    high coefficients onto few low terms. Other coefficient types use
+    ordinary long division."""
+
+    def __init__(self, modulus) -> None:
+        if modulus.is_const():
+            raise ValueError(f"Modulus {modulus} must have positive degree")
+
+        self.modulus = modulus
+        self.deg: int = modulus.deg
+        self.ctx = modulus._int_ctx()  # pylint: disable=protected-access
+        self._inverse: list[int] = [1]
+        self._sparse: list[tuple[int, int]] | None = None
+
+        if self.ctx is not None:
+            self._set_monic(modulus._to_ints())  # pylint: disable=protected-access
+
+    @classmethod
+    def from_ints(cls, ctx, coeff: list[int]) -> "PolyModulus":
+        """Modulus given by integer polynomial ordered from the most significant coefficient"""
+        if len(coeff) < 2:
+            raise ValueError(f"Modulus {coeff} must have positive degree")
+
+        result = cls.__new__(cls)
+        result.modulus = None
+        result.deg = len(coeff) - 1
+        result.ctx = ctx
+        result._inverse = [1]
+        result._sparse = None
+        result._set_monic(coeff)
+        return result
+
+    def _set_monic(self, coeff: list[int]):
+        lead_inv = self.ctx.inv(coeff[0])
+        # Monic modulus has the same remainders
+        self._monic = [c * lead_inv % self.ctx.p for c in coeff]
+        terms = [(i, c) for i, c in enumerate(self._monic[1:], 1) if c]
+        if len(terms) + 1 <= MAX_SPARSE_TERMS:
+            self._sparse = terms
+
+    def reduce(self, poly):
+        """Remainder of polynomial division by modulus"""
+        if poly.deg < self.deg:
+            return poly
+        if self.ctx is None:
+            return poly % self.modulus
+        # pylint: disable=protected-access
+        return poly._from_ints(self.reduce_ints(poly._to_ints()))
+
+    def reduce_ints(self, a: list[int]) -> list[int]:
+        """Remainder of integer polynomial ordered from the most significant coefficient"""
+        if len(a) <= self.deg:
+            return a
+        if self._sparse is not None:
+            return self._reduce_sparse(a)
+        if self.deg < NEWTON_THRESHOLD:
+            return self.ctx.poly_mod(a, self._monic)
+        return self._reduce_newton(a)
+
+    def _reduce_sparse(self, a: list[int]) -> list[int]:
+        # x^n = -sum(c_i x^(n - i)), so each high coefficient folds onto few terms
+        p = self.ctx.p
+        negated = [(i, p - c) for i, c in self._sparse]
+        remainder = list(a)
+        size = len(a) - self.deg
+        for k in range(size):
+            c = remainder[k] % p
+            if c == 0:
+                continue
+            for i, d in negated:
+                remainder[k + i] += c * d
+        return strip_coeff([c % p for c in remainder[size:]])
+
+    def _reduce_newton(self, a: list[int]) -> list[int]:
+        # Quotient is reversed product of reversed dividend and inverse series
+        ctx = self.ctx
+        p = ctx.p
+        n = self.deg
+        k = len(a) - n
+        inverse = self._inverse_series(k)
+
+        quotient = self._mul_le(a[:k], inverse[:k])[:k]
+        quotient += [0] * (k - len(quotient))
+        product = ctx.poly_mul(strip_coeff(quotient), self._monic)
+        low = [0] * (n - len(product)) + product[-n:]
+        return strip_coeff([(x - y) % p for x, y in zip(a[-n:], low)])
+
+    def _inverse_series(self, precision: int) -> list[int]:
+        """Power series inverse of reversed modulus up to x^precision"""
+        p = self.ctx.p
+        # Little endian reversed monic modulus is the list read from the start
+        f = self._monic
+        g = self._inverse
+        while len(g) < precision:
+            size = min(2 * len(g), precision)
+            # Newton step g = g * (2 - f * g) mod x^size
+            e = self._mul_le(f[:size], g)[:size]
+            e = [(p - c) % p for c in e] + [0] * (size - len(e))
+            e[0] = (e[0] + 2) % p
+            g = self._mul_le(g, e)[:size]
+            g += [0] * (size - len(g))
+        self._inverse = g
+        return g
+
+    def _mul_le(self, a: list[int], b: list[int]) -> list[int]:
+        # Product of little endian lists
+        return self.ctx.poly_mul(a[::-1], b[::-1])[::-1]
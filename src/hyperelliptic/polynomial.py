@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from copy import copy
 from .integer import ZP
+from .multiplication import KARATSUBA_THRESHOLD, TOOM3_THRESHOLD, multiply
+from .poly_modulus import PolyModulus
+from .subproduct_tree import SUBPRODUCT_THRESHOLD, SubproductTree
 
 
 def is_int_like(obj):
@@ -35,9 +38,20 @@ def same_type_coeff(function):
     return wrapper
 
 
+def exact_div(coeff, k: int):
+    """Divide coefficient by small integer k knowing that division is exact"""
+    if isinstance(coeff, int):
+        return coeff // k
+    return coeff / k
+
+
 class Polynomial:
     """General use class implementing basic operations on arbitrary polynomials"""
 
+    # Degree thresholds of fast multiplication, see multiplication module
+    KARATSUBA_THRESHOLD = KARATSUBA_THRESHOLD
+    TOOM3_THRESHOLD = TOOM3_THRESHOLD
+
     def __init__(self, coeff, symbol="x"):
         self.coeff = self._strip(coeff)
         self.symbol = symbol
@@ -96,8 +110,12 @@ class Polynomial:
     @same_type_coeff
     def gcd(self, other) -> "Polynomial":
         """Euclidean algorithm for polynomials"""
+        ctx = self._shared_ctx(other)
+        if ctx is not None:
+            return self._from_ints(ctx.poly_gcd(self._to_ints(), other._to_ints()))
+
         r1, r0 = self, other
-        while r0 != self.zero():
+        while r0 != 0:
             r1, r0 = r0, r1 % r0
 
         return r1.to_monic()
@@ -105,28 +123,91 @@ class Polynomial:
     @same_type_coeff
     def xgcd(self, other: "Polynomial"):
         """Extended Euclidean algorithm for polynomials"""
+        ctx = self._shared_ctx(other)
+        if ctx is not None:
+            result = ctx.poly_xgcd(self._to_ints(), other._to_ints())
+            return tuple(self._from_ints(x) for x in result)
+
         # pylint: disable=W0212
         r1, r0 = self._copy(), other._copy()
         s1, s0 = self.one(), self.zero()
         t1, t0 = self.zero(), self.one()
 
-        while r0 != self.zero():
-            q = r1 // r0
-            r1, r0 = r0, r1 - q * r0
+        while r0 != 0:
+            q, r = divmod(r1, r0)
+            r1, r0 = r0, r
             s1, s0 = s0, s1 - q * s0
             t1, t0 = t0, t1 - q * t0
 
         leading_coeff = r1.leading_coeff
-        if leading_coeff != self.one():
+        if leading_coeff != self.coeff_one():
             r1 = r1 / leading_coeff
             s1 = s1 / leading_coeff
             t1 = t1 / leading_coeff
 
         return r1, s1, t1
 
+    def evaluate_many(self, xs) -> list:
+        """Values of polynomial at many points. Over prime field polynomials
+        of large degree are evaluated with subproduct trees built on chunks
+        of deg + 1 points, in quasi-linear time"""
+        xs = list(xs)
+        ctx = self._int_ctx()
+        if (
+            ctx is None
+            or self.deg < SUBPRODUCT_THRESHOLD
+            or not all(is_int_like(x) for x in xs)
+        ):
+            return [self(x) for x in xs]
+
+        a = self._to_ints()
+        points = [self._scalar_to_int(ctx, x) for x in xs]
+        values = []
+        for i in range(0, len(points), self.deg + 1):
+            tree = SubproductTree(ctx, points[i : i + self.deg + 1])
+            values.extend(tree.evaluate(a))
+        element = self.coeff_zero().gf.element
+        return [element(v) for v in values]
+
     def _copy(self):
         return Polynomial(self.coeff)
 
+    def _int_ctx(self):
+        """Integer arithmetic context of coefficients or None for generic coefficients"""
+        return None
+
+    def _characteristic(self):
+        """Characteristic of coefficient ring"""
+        gf = getattr(self.leading_coeff, "gf", None)
+        return getattr(gf, "p", 0)
+
+    def _shared_ctx(self, other):
+        """Integer arithmetic context usable for operation on both polynomials"""
+        ctx = self._int_ctx()
+        if ctx is None or not isinstance(other, Polynomial):
+            return None
+        # pylint: disable=W0212
+        other_ctx = other._int_ctx()
+        if other_ctx is None:
+            return None
+        if other_ctx.p != ctx.p:
+            raise ValueError(f"{self} field does not match {other} field")
+        return ctx
+
+    def _scalar_to_int(self, ctx, scalar):
+        if not isinstance(scalar, ZP):
+            return scalar % ctx.p
+        if scalar.p != ctx.p:
+            raise ValueError(f"{self} field does not match {scalar} field")
+        return scalar.value
+
+    def _to_ints(self):
+        return [c.value for c in self.coeff]
+
+    def _from_ints(self, values):
+        field = self.coeff_zero().gf
+        return self._from_coeff([field.element(v) for v in values])
+
     def _from_coeff(self, coeff):
         return Polynomial(coeff, self.symbol)
 
@@ -145,6 +226,10 @@ class Polynomial:
         raise TypeError("Invalid argument for polynomial addition")
 
     def __add_poly(self, other: "Polynomial") -> "Polynomial":
+        ctx = self._shared_ctx(other)
+        if ctx is not None:
+            return self._from_ints(ctx.poly_add(self._to_ints(), other._to_ints()))
+
         zero_coeff = self.coeff_zero()
         size = max(self.deg, other.deg)
         s_coeff = [zero_coeff] * (size - self.deg) + self.coeff
@@ -168,16 +253,33 @@ class Polynomial:
     @same_type_coeff
     def __mul__(self, other: "Polynomial" | int | ZP) -> "Polynomial":
         if is_number_like(other):
+            ctx = self._int_ctx()
+            if ctx is not None and is_int_like(other):
+                value = self._scalar_to_int(ctx, other)
+                return self._from_ints(ctx.poly_scale(self._to_ints(), value))
             return self._from_coeff(list(map(lambda x: x * other, self.coeff)))
         if isinstance(other, Polynomial):
             return self.__mul_poly(other)
         raise TypeError("Invalid argument for polynomial multiplication")
 
     def __mul_poly(self, other: "Polynomial") -> "Polynomial":
-        result = [self.coeff_zero()] * (self.deg + other.deg + 1)
-        for e1, c1 in enumerate(self.coeff):
-            for e2, c2 in enumerate(other.coeff):
-                result[e1 + e2] += c1 * c2
+        ctx = self._shared_ctx(other)
+        if ctx is not None and other is self:
+            return self._from_ints(ctx.poly_sqr(self._to_ints()))
+        if ctx is not None:
+            return self._from_ints(ctx.poly_mul(self._to_ints(), other._to_ints()))
+
+        # Toom-3 interpolation divides by 2 and 3
+        characteristics = (self._characteristic(), other._characteristic())
+        divisible = not any(c in (2, 3) for c in characteristics)
+        result = multiply(
+            self.coeff,
+            other.coeff,
+            self.coeff_zero(),
+            exact_div if divisible else None,
+            self.KARATSUBA_THRESHOLD,
+            self.TOOM3_THRESHOLD,
+        )
         return self._from_coeff(result)
 
     @same_type_coeff
@@ -187,6 +289,10 @@ class Polynomial:
     @same_type_coeff
     def __truediv__(self, other):
         if isinstance(other, self.leading_coeff.__class__) or is_int_like(other):
+            ctx = self._int_ctx()
+            if ctx is not None:
+                value = self._scalar_to_int(ctx, other)
+                return self._from_ints(ctx.poly_scale(self._to_ints(), ctx.inv(value)))
             return self._from_coeff(list(map(lambda x: x / other, self.coeff)))
         return NotImplemented
 
@@ -197,22 +303,53 @@ class Polynomial:
         if other.is_const():
             return self / other.to_int(), self.zero()
 
-        zero = self.coeff_zero()
-        one = self.coeff_one()
-        remainder = self._copy()
-        quotient = Polynomial([zero])
-
-        while remainder != self.zero() and other.deg <= remainder.deg:
-            t = remainder.leading_coeff / other.leading_coeff
-            m = Polynomial([one] + [zero] * (remainder.deg - other.deg))
-            quotient = quotient + t * m
-            remainder = remainder - t * other * m
+        ctx = self._shared_ctx(other)
+        if ctx is not None:
+            q, r = ctx.poly_divmod(self._to_ints(), other._to_ints())
+            return self._from_ints(q), self._from_ints(r)
 
-        return self._from_coeff(quotient.coeff), self._from_coeff(remainder.coeff)
+        quotient, remainder = self._long_division(other, with_quotient=True)
+        return self._from_coeff(quotient), self._from_coeff(remainder)
 
     @same_type_coeff
     def __mod__(self, other):
-        return divmod(self, other)[1]
+        if self.deg < other.deg:
+            return self
+        if other.is_const():
+            return divmod(self, other)[1]
+
+        ctx = self._shared_ctx(other)
+        if ctx is not None:
+            return self._from_ints(ctx.poly_mod(self._to_ints(), other._to_ints()))
+        return self._from_coeff(self._long_division(other, with_quotient=False)[1])
+
+    def _long_division(self, other, with_quotient: bool):
+        """In-place long division of coefficient lists. Divisor has positive degree
+        and is not longer than dividend. Quotient is None if it is not requested."""
+        divisor = other.coeff
+        remainder = list(self.coeff)
+        size = len(remainder) - len(divisor) + 1
+        quotient = [self.coeff_zero()] * size if with_quotient else None
+
+        # Leading coefficient is inverted once, if coefficients support it
+        lead = other.leading_coeff
+        monic = lead == 1
+        lead_inv = None if monic or not hasattr(lead, "inverse") else lead.inverse()
+
+        for i in range(size):
+            c = remainder[i]
+            if c == 0:
+                continue
+            if lead_inv is not None:
+                c = c * lead_inv
+            elif not monic:
+                c = c / lead
+            if quotient is not None:
+                quotient[i] = c
+            for j, d in enumerate(divisor[1:], i + 1):
+                remainder[j] = remainder[j] - c * d
+
+        return quotient, remainder[size:]
 
     @same_type_coeff
     def __floordiv__(self, other):
@@ -222,6 +359,11 @@ class Polynomial:
         if not is_int_like(other):
             raise NotImplementedError(f"Polynomial exp error (exp = {other})")
 
+        if isinstance(mod, Polynomial) and not mod.is_const():
+            # Precomputed modulus pays off over repeated reductions
+            mod = PolyModulus(mod)
+        reduce = mod.reduce if isinstance(mod, PolyModulus) else lambda x: x % mod
+
         sq = self
         exp = other if isinstance(other, int) else other.value
         result = self.one()
@@ -230,14 +372,17 @@ class Polynomial:
             if exp % 2 == 1:
                 result = result * sq
                 if mod is not None:
-                    result = result % mod
+                    result = reduce(result)
             sq *= sq
             if mod is not None:
-                sq = sq % mod
+                sq = reduce(sq)
             exp = exp // 2
         return result
 
     def __neg__(self):
+        ctx = self._int_ctx()
+        if ctx is not None:
+            return self._from_ints(ctx.poly_neg(self._to_ints()))
         return self._from_coeff(list(map(lambda x: -x, self.coeff)))
 
     def __eq__(self, other):
@@ -253,9 +398,16 @@ class Polynomial:
         return str(self)
 
     def __call__(self, x):
-        return sum(
-            [x**i * c for i, c in enumerate(self.coeff[::-1])], self.coeff_zero()
-        )
+        ctx = self._int_ctx()
+        if ctx is not None and is_int_like(x):
+            value = ctx.poly_eval(self._to_ints(), self._scalar_to_int(ctx, x))
+            return self.coeff_zero().gf.element(value)
+
+        # Horner's rule
+        result = self.coeff_zero()
+        for c in self.coeff:
+            result = result * x + c
+        return result
 
     def __str__(self):
         if all(x == 0 for x in self.coeff):
@@ -1,172 +1,94 @@
-"""List of all primes less than 1000"""
-
-PRIMES = [
-    2,
-    3,
-    5,
-    7,
-    11,
-    13,
-    17,
-    19,
-    23,
-    29,
-    31,
-    37,
-    41,
-    43,
-    47,
-    53,
-    59,
-    61,
-    67,
-    71,
-    73,
-    79,
-    83,
-    89,
-    97,
-    101,
-    103,
-    107,
-    109,
-    113,
-    127,
-    131,
-    137,
-    139,
-    149,
-    151,
-    157,
-    163,
-    167,
-    173,
-    179,
-    181,
-    191,
-    193,
-    197,
-    199,
-    211,
-    223,
-    227,
-    229,
-    233,
-    239,
-    241,
-    251,
-    257,
-    263,
-    269,
-    271,
-    277,
-    281,
-    283,
-    293,
-    307,
-    311,
-    313,
-    317,
-    331,
-    337,
-    347,
-    349,
-    353,
-    359,
-    367,
-    373,
-    379,
-    383,
-    389,
-    397,
-    401,
-    409,
-    419,
-    421,
-    431,
-    433,
-    439,
-    443,
-    449,
-    457,
-    461,
-    463,
-    467,
-    479,
-    487,
-    491,
-    499,
-    503,
-    509,
-    521,
-    523,
-    541,
-    547,
-    557,
-    563,
-    569,
-    571,
-    577,
-    587,
-    593,
-    599,
-    601,
-    607,
-    613,
-    617,
-    619,
-    631,
-    641,
-    643,
-    647,
-    653,
-    659,
-    661,
-    673,
-    677,
-    683,
-    691,
-    701,
-    709,
-    719,
-    727,
-    733,
-    739,
-    743,
-    751,
-    757,
-    761,
-    769,
-    773,
-    787,
-    797,
-    809,
-    811,
-    821,
-    823,
-    827,
-    829,
-    839,
-    853,
-    857,
-    859,
-    863,
-    877,
-    881,
-    883,
-    887,
-    907,
-    911,
-    919,
-    929,
-    937,
-    941,
-    947,
-    953,
-    967,
-    971,
-    977,
-    983,
-    991,
-    997,
-]
+"""(module) containing segmented sieve of Eratosthenes and prime iterators"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from math import isqrt
+
+from .utils import is_prime
+
+# Width of a single sieved segment
+SEGMENT_SIZE = 2**16
+
+# Primes up to this bound may be kept in the cache
+MAX_CACHED = 2**26
+
+# Beyond this bound next_prime tests candidates instead of sieving
+MAX_SIEVED = 2**40
+
+_cache = array("Q", [2, 3, 5, 7])
+_cache_limit = 10
+
+
+def _sieve_segment(low: int, high: int, base_primes) -> bytearray:
+    """Flags of primality of integers in range [low, high)"""
+    segment = bytearray([1]) * (high - low)
+    for p in base_primes:
+        if p * p >= high:
+            break
+        start = max(p * p, (low + p - 1) // p * p)
+        segment[start - low :: p] = bytes(len(range(start, high, p)))
+    for i in range(low, min(2, high)):
+        segment[i - low] = 0
+    return segment
+
+
+def _extend_cache(limit: int) -> None:
+    """Make sure all primes up to limit are cached"""
+    global _cache_limit  # pylint: disable=W0603
+    if limit <= _cache_limit:
+        return
+
+    new_limit = max(limit, min(2 * _cache_limit, MAX_CACHED))
+    _extend_cache(isqrt(new_limit))
+    for low in range(_cache_limit + 1, new_limit + 1, SEGMENT_SIZE):
+        high = min(low + SEGMENT_SIZE, new_limit + 1)
+        segment = _sieve_segment(low, high, _cache)
+        _cache.extend(low + i for i, flag in enumerate(segment) if flag)
+    _cache_limit = new_limit
+
+
+def primes_up_to(n: int) -> list[int]:
+    """Returns list of all primes p <= n"""
+    if n <= MAX_CACHED:
+        _extend_cache(n)
+        return _cache[: bisect_right(_cache, n)].tolist()
+    return list(iter_primes(2, n + 1))
+
+
+def iter_primes(start: int = 2, stop: int | None = None):
+    """Lazily yields primes p such that start <= p < stop (unbounded if stop is None)"""
+    low = max(start, 2)
+    if stop is not None and stop - 1 <= MAX_CACHED:
+        _extend_cache(stop - 1)
+
+    # Primes below cache limit are served from cache
+    cache_limit = _cache_limit
+    if low <= cache_limit:
+        end = cache_limit + 1 if stop is None else min(stop, cache_limit + 1)
+        i = bisect_left(_cache, low)
+        while i < len(_cache) and _cache[i] < end:
+            yield _cache[i]
+            i += 1
+        low = cache_limit + 1
+
+    while stop is None or low < stop:
+        high = low + SEGMENT_SIZE if stop is None else min(low + SEGMENT_SIZE, stop)
+        _extend_cache(isqrt(high - 1))
+        segment = _sieve_segment(low, high, _cache)
+        for i, flag in enumerate(segment):
+            if flag:
+                yield low + i
+        low = high
+
+
+def next_prime(n: int) -> int:
+    """Returns the smallest prime p > n"""
+    if n < 2:
+        return 2
+    if n < MAX_SIEVED:
+        return next(iter_primes(n + 1))
+
+    candidate = n + 1 if n % 2 == 0 else n + 2
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
@@ -0,0 +1,41 @@
+"""(module) containing bounded registry used for interning of fields"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class Registry:
+    """Process-wide cache of validated objects with bounded size.
+    Least recently used entries are evicted first."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize: int = maxsize
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, factory):
+        """Return object registered under key, creating it with factory if missing"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        # Factory runs outside the lock as validation can be expensive
+        value = factory()
+        with self._lock:
+            value = self._items.setdefault(key, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all registered objects"""
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
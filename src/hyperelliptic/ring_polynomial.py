@@ -1,15 +1,56 @@
 """(module) containing implementation of polynomial ring over arbitrary finite field"""
 
-from .utils import factors as int_factors
+from .berlekamp import berlekamp_factors, berlekamp_supported
+from .factorization import factors as int_factors
+from .field_context import strip_coeff
+from .frobenius import FrobeniusContext
+from .poly_modulus import PolyModulus
 from .polynomial import Polynomial
+from .integer import ZP
 
 
 class RingPolynomial(Polynomial):
-    """RingPolynomial implements polynomials with coefficients from finite field"""
+    """RingPolynomial implements polynomials with coefficients from finite field.
+    Over prime field coefficients are stored densely as integers reduced mod p
+    and wrapped into ZP elements only when coeff is accessed."""
 
     def __init__(self, field, coeff, symbol="x"):
         self.gf = field
-        super().__init__(coeff, symbol)
+        self._ints = None
+        self._coeff = None
+
+        ctx = getattr(field, "ctx", None)
+        if ctx is None or not all(isinstance(c, (int, ZP)) for c in coeff):
+            super().__init__(coeff, symbol)
+            return
+
+        self.symbol = symbol
+        self._has_int_coeff = True
+        self._set_ints(strip_coeff([self._scalar_to_int(ctx, c) for c in coeff]))
+
+    @property
+    def coeff(self):
+        """Coefficients ordered from the most significant one"""
+        if self._coeff is None:
+            self._coeff = [self.gf.element(c) for c in self._ints]
+        return self._coeff
+
+    @coeff.setter
+    def coeff(self, value):
+        self._coeff = value
+        self._ints = None
+
+    @property
+    def deg(self):
+        if self._ints is None:
+            return len(self._coeff) - 1
+        return len(self._ints) - 1
+
+    @property
+    def leading_coeff(self):
+        if self._ints is None:
+            return self._coeff[0]
+        return self.gf.element(self._ints[0])
 
     def coeff_zero(self):
         return self.gf.zero()
@@ -17,6 +58,34 @@ class RingPolynomial(Polynomial):
     def coeff_one(self):
         return self.gf.one()
 
+    def _int_ctx(self):
+        # Only polynomials over prime field have integer coefficients
+        if self._ints is None:
+            return None
+        return self.gf.ctx
+
+    def _set_ints(self, values: list[int]):
+        # FieldContext routines never modify their arguments, so the list is shared
+        self._coeff = None
+        self._ints = values
+
+    def _to_ints(self):
+        if self._ints is None:
+            return super()._to_ints()
+        return self._ints
+
+    def _from_ints(self, values):
+        # Values produced by FieldContext are already reduced and stripped
+        poly = RingPolynomial.__new__(RingPolynomial)
+        poly.gf = self.gf
+        poly.symbol = self.symbol
+        poly._has_int_coeff = True
+        poly._set_ints(values)
+        return poly
+
+    def _characteristic(self):
+        return self.gf.p
+
     def factors(self):
         """
         Returns factors of polynomial. Returns list of poolynomials that divide this element.
@@ -26,6 +95,10 @@ class RingPolynomial(Polynomial):
         sf_factors = self.square_free_factors()
 
         for sf_factor in sf_factors:
+            if sf_factor._uses_berlekamp():
+                factors.extend(sf_factor.berlekamp_factors())
+                continue
+
             df_factors = sf_factor.distinct_degree_factors()
 
             for df_factor, deg in df_factors:
@@ -34,6 +107,56 @@ class RingPolynomial(Polynomial):
 
         return factors
 
+    def _uses_berlekamp(self) -> bool:
+        """Check if square-free factors are split with Berlekamp algorithm
+        (prime fields of small characteristic) instead of Cantor Zassenhaus"""
+        return self._int_ctx() is not None and berlekamp_supported(self.gf.p, self.deg)
+
+    def berlekamp_factors(self) -> list["RingPolynomial"]:
+        """Berlekamp algorithm, irreducible factors of square-free polynomial
+        over prime field are found from nullspace of its Q - I matrix"""
+        # pylint: disable=protected-access
+        poly = self.to_monic()
+        return [poly._from_ints(f) for f in berlekamp_factors(self.gf, poly._to_ints())]
+
+    def roots(self) -> list:
+        """Returns roots of polynomial in its field, repeated according to multiplicity.
+        Product of distinct linear factors gcd(f, x^q - x) is found with single
+        modular exponentiation and split into linear factors (Rabin root finding)."""
+        if self.deg < 1:
+            return []
+
+        poly = self.to_monic()
+        x = self._from_coeff([self.coeff_one(), self.coeff_zero()])
+        xq = pow(x, self.gf.q, poly)
+        g = poly.gcd(xq - x % poly)
+
+        result = []
+        for linear in g.equal_degree_factors(1):
+            root = -linear.coeff[-1]
+            # Multiplicity is found with synthetic division by x - root
+            quotient, remainder = divmod(poly, linear)
+            while remainder == 0:
+                result.append(root)
+                quotient, remainder = divmod(quotient, linear)
+        return result
+
+    def _splitting_poly(self, a, deg: int = 1) -> "RingPolynomial":
+        """Polynomial whose gcd with self is nontrivial with probability about 1/2,
+        when all irreducible factors of self have degree deg"""
+        gf = self.gf
+        modulus = PolyModulus(self)
+        if gf.p != 2:
+            return pow(a, (gf.q**deg - 1) // 2, modulus) - self.one()
+
+        # Trace map a + a^2 + ... + a^(2^(m * deg - 1)) modulo self
+        t = modulus.reduce(a)
+        trace = t
+        for _ in range(gf.m * deg - 1):
+            t = modulus.reduce(t * t)
+            trace = trace + t
+        return trace
+
     def gcd(self, other: "RingPolynomial") -> "RingPolynomial":
         return self._from_coeff(super().gcd(other).coeff)
 
@@ -59,80 +182,88 @@ class RingPolynomial(Polynomial):
 
         # Step two
         if c != self.one():
-            coeff = [x ** (gf.p ** (gf.m - 1)) for x in c.coeff]
-            factors.extend(gf.poly(coeff).square_free_factors())
+            # c = r(x)^p, coefficients of r are p-th roots of every p-th coefficient
+            coeff = [x ** (gf.p ** (gf.m - 1)) for x in c.coeff[:: gf.p]]
+            for fac in gf.poly(coeff).square_free_factors():
+                factors.extend([fac] * gf.p)
 
         return factors
 
     def distinct_degree_factors(self) -> list[tuple["RingPolynomial", int]]:
         """Split a square-free polynomial into a product of polynomials
         whose irreducible factors all have the same degree."""
-        gf = self.gf
         factors = []
-        poly = self._from_coeff(self.coeff)
-        x = self._from_coeff([self.coeff_one(), self.coeff_zero()])
+        poly = self.to_monic()
+        frobenius = FrobeniusContext(poly)
+        h = frobenius.x
 
         i = 1
-        while i <= self.deg // 2:
-            h = pow(x, gf.p, poly)
-            g = poly.gcd(h - x)
+        while 2 * i <= poly.deg:
+            # h = x^(q^i) mod poly
+            h = frobenius.compose(h)
+            g = poly.gcd(h - frobenius.x)
             if g != self.one():
                 factors.append((g, i))
                 poly = poly // g
+                if poly.deg < 2 * (i + 1):
+                    break
+                # Frobenius context of the remaining factor reuses x^q
+                frobenius = FrobeniusContext(poly, frobenius.xq % poly)
                 h = h % poly
             i = i + 1
 
-        if poly != self.one():
+        if poly.deg > 0:
             factors.append((poly, poly.deg))
         return factors
 
     def equal_degree_factors(self, deg) -> list["RingPolynomial"]:
-        """Cantor Zassenhaus algorithm"""
+        """Cantor Zassenhaus algorithm. Square-free polynomial whose irreducible
+        factors all have degree deg is split recursively, every exponentiation
+        is done modulo the factor being split."""
         gf = self.gf
-        factors = [self._from_coeff(self.coeff)]
-
-        while len(factors) < self.deg // deg:
-            rand = gf.rand_poly(deg)
-            g = self.gcd(rand)
-            if g == self.one():
-                g = (rand ** ((gf.p**deg - 1) // 2) - self.one()) % self
-
-            for fac in factors:
-                if fac.deg <= deg:
-                    continue
-                d = g.gcd(fac)
-                if d not in [self.one(), fac]:
-                    # pylint: disable=W4701
-                    factors.remove(fac)
-                    factors.append(d)
-                    factors.append(fac // d)
+        factors = []
+        stack = [self.to_monic()]
+        while stack:
+            poly = stack.pop()
+            if poly.deg <= deg:
+                if poly.deg > 0:
+                    factors.append(poly.to_monic())
+                continue
+
+            rand = gf.rand_poly(poly.deg - 1)
+            d = poly.gcd(rand)
+            if d.deg == 0:
+                d = poly.gcd(poly._splitting_poly(rand, deg))
+            if 0 < d.deg < poly.deg:
+                stack.extend([d, poly // d])
+            else:
+                stack.append(poly)
 
         return factors
 
     def is_irreducible(self):
         """Rabin test of irreducibility"""
-        gf = self.gf
-        deg_factors = int_factors(self.deg)
-        quotients = set([self.deg // factor for factor in deg_factors])
-        x = self._from_coeff([self.coeff_one(), self.coeff_zero()])
+        if self.deg < 1:
+            return False
+        frobenius = FrobeniusContext(self)
+        x = frobenius.x
 
-        prev_h = x
-        prev_q = 0
-        for quotient in quotients:
-            h = pow(prev_h, pow(gf.p, quotient - prev_q), self)
-            g = self.gcd((h - x) % self)
-            if g != self.one():
+        # Only x^(q^(n/r)) for primes r dividing n and x^(q^n) are needed
+        for r in sorted(set(int_factors(self.deg)), reverse=True):
+            h = frobenius.x_power(self.deg // r)
+            if self.gcd(h - x) != self.one():
                 return False
-            prev_h, prev_q = h, quotient
-        g = pow(prev_h, pow(gf.p, self.deg - prev_q), self)
-        g = (g - x) % self
-
-        if g == self.zero():
-            return True
-        return False
+        return frobenius.x_power(self.deg) == x
 
     def _from_coeff(self, coeff):
         return RingPolynomial(self.gf, coeff, self.symbol)
 
-    def __floordiv__(self, other) -> "RingPolynomial":
-        return self._from_coeff(super().__floordiv__(other).coeff)
+    def __eq__(self, other):
+        # pylint: disable=W0212
+        if self._ints is None:
+            return super().__eq__(other)
+        if isinstance(other, int):
+            return len(self._ints) == 1 and self._ints[0] == other % self.gf.p
+        if isinstance(other, RingPolynomial) and other._ints is not None:
+            return self.gf.p == other.gf.p and self._ints == other._ints
+        return super().__eq__(other)
@@ -0,0 +1,106 @@
+"""(module) containing square root engine of finite fields"""
+
+
+class ElementOps:
+    """Arithmetic on field elements exposed with the same interface as FieldContext"""
+
+    def add(self, a, b):
+        """Sum of two elements"""
+        return a + b
+
+    def sub(self, a, b):
+        """Difference of two elements"""
+        return a - b
+
+    def mul(self, a, b):
+        """Product of two elements"""
+        return a * b
+
+    def sqr(self, a):
+        """Square of an element"""
+        return a * a
+
+    def pow(self, a, exp: int):
+        """Power of an element"""
+        return pow(a, exp)
+
+
+class SqrtContext:
+    """Square roots in field of order q. Constants of Tonelli-Shanks algorithm
+    and a quadratic non-residue are computed once per field. Formula is selected
+    by q mod 8 and each root is found together with residuosity test."""
+
+    def __init__(self, q: int, ops, zero, one, find_non_residue) -> None:
+        self.q: int = q
+        self.ops = ops
+        self.zero = zero
+        self.one = one
+        self._find_non_residue = find_non_residue
+        self._c = None
+
+        # find Q and S such that q - 1 = Q * 2^S
+        self.s: int = 0
+        self.q_odd: int = q - 1
+        while self.q_odd % 2 == 0 and self.q_odd > 0:
+            self.q_odd //= 2
+            self.s += 1
+
+    def sqrt(self, a):
+        """Returns square root of a or None if a is not a quadratic residue"""
+        if a == self.zero:
+            return self.zero
+        if self.q % 2 == 0:
+            # Squaring is bijective in char(2) fields
+            return self.ops.pow(a, self.q // 2)
+        if self.q % 4 == 3:
+            return self._sqrt_3_mod_4(a)
+        if self.q % 8 == 5:
+            return self._sqrt_5_mod_8(a)
+        return self._tonelli_shanks(a)
+
+    def _check(self, a, r):
+        return r if self.ops.sqr(r) == a else None
+
+    def _sqrt_3_mod_4(self, a):
+        return self._check(a, self.ops.pow(a, (self.q + 1) // 4))
+
+    def _sqrt_5_mod_8(self, a):
+        """Atkin's algorithm"""
+        ops = self.ops
+        two_a = ops.add(a, a)
+        b = ops.pow(two_a, (self.q - 5) // 8)
+        i = ops.mul(two_a, ops.sqr(b))
+        r = ops.mul(ops.mul(a, b), ops.sub(i, self.one))
+        return self._check(a, r)
+
+    def _tonelli_shanks(self, a):
+        ops = self.ops
+        if self._c is None:
+            self._c = ops.pow(self._find_non_residue(), self.q_odd)
+
+        # r = a^((Q + 1) / 2) and t = a^Q share single exponentiation
+        x = ops.pow(a, (self.q_odd - 1) // 2)
+        r = ops.mul(a, x)
+        t = ops.mul(r, x)
+        c = self._c
+        m = self.s
+
+        while t != self.one:
+            # Find the least i such that t^2^i = 1
+            i = 0
+            t2 = t
+            while t2 != self.one:
+                t2 = ops.sqr(t2)
+                i += 1
+                if i == m:
+                    # t has order 2^m, so a is not a quadratic residue
+                    return None
+
+            b = c
+            for _ in range(m - i - 1):
+                b = ops.sqr(b)
+            m = i
+            c = ops.sqr(b)
+            t = ops.mul(t, c)
+            r = ops.mul(r, b)
+        return r
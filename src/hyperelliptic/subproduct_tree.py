@@ -0,0 +1,83 @@
+"""(module) containing subproduct tree of linear factors over prime field"""
+
+from .poly_modulus import NEWTON_THRESHOLD, PolyModulus
+
+# Polynomials of lower degree are evaluated point by point with Horner's rule
+SUBPRODUCT_THRESHOLD = 256
+
+# Remainders at nodes with at most that many points are evaluated with Horner's rule
+LEAF_SIZE = 32
+
+
+class SubproductTree:
+    """Binary tree of products of linear factors (x - x_i) over prime field.
+    Leaves are the linear factors and each node is a product of its children.
+    Polynomials are lists of integers ordered from the most significant coefficient."""
+
+    def __init__(self, ctx, points: list[int]) -> None:
+        if not points:
+            raise ValueError("Subproduct tree requires at least one point")
+
+        self.ctx = ctx
+        self.points: list[int] = points
+        level = [[1, ctx.neg(x)] for x in points]
+        self.levels: list[list[list[int]]] = [level]
+        while len(level) > 1:
+            # Node without a sibling is carried to the next level unchanged
+            level = [
+                ctx.poly_mul(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+            self.levels.append(level)
+
+    @property
+    def root(self) -> list[int]:
+        """Product of all linear factors"""
+        return self.levels[-1][0]
+
+    def evaluate(self, a: list[int]) -> list[int]:
+        """Values of polynomial at all points. Remainders are pushed down the tree,
+        value at a point is the remainder modulo its linear factor."""
+        ctx = self.ctx
+        # Nodes at level j cover 2^j consecutive points
+        bottom = min(LEAF_SIZE.bit_length() - 1, len(self.levels) - 1)
+        remainders = [self._mod(a, self.root)]
+        for level in reversed(self.levels[bottom:-1]):
+            remainders = [
+                self._mod(remainders[i // 2], node) for i, node in enumerate(level)
+            ]
+
+        size = 2**bottom
+        return [
+            ctx.poly_eval(remainders[i // size], x) for i, x in enumerate(self.points)
+        ]
+
+    def interpolate(self, values: list[int]) -> list[int]:
+        """Polynomial of degree lower than number of points taking given values.
+        Barycentric weights 1 / m'(x_i) are found with single batch inversion
+        and weighted values are combined up the tree."""
+        ctx = self.ctx
+        p = ctx.p
+        n = len(self.root) - 1
+        derivative = [c * (n - i) % p for i, c in enumerate(self.root[:-1])]
+        weights = ctx.batch_inv(self.evaluate(derivative))
+
+        terms = [[ctx.mul(v, w)] for v, w in zip(values, weights)]
+        for level in self.levels[:-1]:
+            terms = [
+                (
+                    ctx.poly_add(
+                        ctx.poly_mul(terms[i], level[i + 1]),
+                        ctx.poly_mul(terms[i + 1], level[i]),
+                    )
+                    if i + 1 < len(level)
+                    else terms[i]
+                )
+                for i in range(0, len(level), 2)
+            ]
+        return terms[0]
+
+    def _mod(self, a: list[int], node: list[int]) -> list[int]:
+        if len(node) <= NEWTON_THRESHOLD:
+            return self.ctx.poly_mod(a, node)
+        return PolyModulus.from_ints(self.ctx, node).reduce_ints(a)
@@ -1,11 +1,6 @@
 """(module) with set of various tools used in hyperelliptic packet"""
 
 from random import randrange
-from math import gcd, log, floor
-from itertools import combinations
-from functools import reduce
-
-from .primes import PRIMES
 
 
 def gf_operation(function):
@@ -15,7 +10,8 @@ def gf_operation(function):
     def function_wrapper(a, b):
         # pylint: disable=C0123
         is_field_operation = type(a) == type(b)
-        if is_field_operation and a.gf != b.gf:
+        # Interned fields are matched by identity before falling back to equality
+        if is_field_operation and a.gf is not b.gf and a.gf != b.gf:
             raise ValueError(f"{a} field does not match {b} field")
         return function(a, b)
 
@@ -51,53 +47,22 @@ def is_prime(p, k=32):
     return True
 
 
-def all_factors(N):
-    """Returns set of all factors of N."""
-    result = set([1, N])
-    divisors = factors(N)
-
-    for i in range(1, len(divisors) + 1):
-        for c in combinations(divisors, i):
-            result.add(reduce((lambda x, y: x * y), c))
-
-    return result
-
-
-def factors(n):
-    """Returns factors of an integer provided as an argument"""
-    computed_factors = []
-
-    while n > 1:
-        x = factor(n)
-        computed_factors.append(x)
-        n = n // x
-
-    return computed_factors
-
-
-def factor(n, smoothness_bound=1):
-    """Factor small numbers with pollard's p - 1"""
-    if is_prime(n):
-        return n
-
-    max_bound = 1000
-    if smoothness_bound > max_bound:
-        raise ValueError(f"Can not factor {n}")
-
-    primes = list(filter(lambda x: x <= smoothness_bound, PRIMES))
-
-    m = 1
-    for p in primes:
-        m *= p ** floor(log(smoothness_bound, p))
-
-    a = 3 if n % 2 == 0 else 2
-    g = gcd(pow(a, m, n) - 1, n)
-
-    if 1 < g < n:
-        return g
-
-    if g == 1:
-        return factor(n, smoothness_bound * 2)
-
-    if g == n:
-        raise ValueError(f"Can not factor {n}")
+def jacobi(a, n):
+    """Jacobi symbol (a/n) for odd positive n computed with quadratic reciprocity"""
+    if n <= 0 or n % 2 == 0:
+        raise ValueError(f"Jacobi symbol is not defined for n = {n}")
+
+    a %= n
+    result = 1
+    while a != 0:
+        # Remove factors of two, (2/n) = -1 for n = 3, 5 mod 8
+        twos = (a & -a).bit_length() - 1
+        a >>= twos
+        if twos % 2 == 1 and n % 8 in (3, 5):
+            result = -result
+        # Quadratic reciprocity for odd a and n
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a, n = n % a, a
+
+    return result if n == 1 else 0